@@ -1,6 +1,6 @@
 """Optimized article search with caching and parallel processing."""
 
-import hashlib
+import asyncio
 
 from .. import ensure_list
 from ..constants import ARTICLE_SEARCH_CACHE_TTL
@@ -9,6 +9,16 @@ from ..utils.request_cache import get_cache
 from .search import PubmedRequest
 from .unified import search_articles_unified
 
+SearchCacheKey = tuple[
+    tuple[str, ...],
+    tuple[str, ...],
+    tuple[str, ...],
+    tuple[str, ...],
+    tuple[str, ...],
+    bool,
+    bool,
+]
+
 # Cache for article search results (1 hour TTL)
 _search_cache = get_cache(
     "article_search", ttl_seconds=ARTICLE_SEARCH_CACHE_TTL
@@ -16,21 +26,29 @@ _search_cache = get_cache(
 
 
 def _get_search_cache_key(
-    request: PubmedRequest, include_preprints: bool, include_cbioportal: bool
-) -> str:
-    """Generate a cache key for search requests."""
-    # Create a deterministic key from search parameters
-    key_parts = [
-        f"chemicals:{sorted(request.chemicals)}",
-        f"diseases:{sorted(request.diseases)}",
-        f"genes:{sorted(request.genes)}",
-        f"keywords:{sorted(request.keywords)}",
-        f"variants:{sorted(request.variants)}",
-        f"preprints:{include_preprints}",
-        f"cbioportal:{include_cbioportal}",
-    ]
-    key_string = "|".join(key_parts)
-    return hashlib.sha256(key_string.encode()).hexdigest()
+    chemicals: list[str],
+    diseases: list[str],
+    genes: list[str],
+    keywords: list[str],
+    variants: list[str],
+    include_preprints: bool,
+    include_cbioportal: bool,
+) -> SearchCacheKey:
+    """Generate a cache key for search requests.
+
+    The search cache lives in process memory, so the key is a plain
+    tuple of the sorted search terms: it is hashed natively by the
+    cache and compared exactly, with no digest built per request.
+    """
+    return (
+        tuple(sorted(chemicals)),
+        tuple(sorted(diseases)),
+        tuple(sorted(genes)),
+        tuple(sorted(keywords)),
+        tuple(sorted(variants)),
+        include_preprints,
+        include_cbioportal,
+    )
 
 
 async def article_searcher_optimized(
@@ -45,40 +63,46 @@ async def article_searcher_optimized(
 ) -> str:
     """Optimized version of article_searcher with caching and context reuse."""
 
-    # Convert parameters to PubmedRequest
-    request = PubmedRequest(
-        chemicals=ensure_list(chemicals, split_strings=True),
-        diseases=ensure_list(diseases, split_strings=True),
-        genes=ensure_list(genes, split_strings=True),
-        keywords=ensure_list(keywords, split_strings=True),
-        variants=ensure_list(variants, split_strings=True),
-    )
+    chemicals = ensure_list(chemicals, split_strings=True)
+    diseases = ensure_list(diseases, split_strings=True)
+    genes = ensure_list(genes, split_strings=True)
+    keywords = ensure_list(keywords, split_strings=True)
+    variants = ensure_list(variants, split_strings=True)
 
-    # Check cache first
+    # Check if we're in a search context (for reusing validated entities).
+    # Validate before building the cache key so the key reflects the
+    # genes that are actually searched.
+    context = get_search_context()
+    if context and genes:
+        # Pre-validate genes using cached results
+        is_valid = await asyncio.gather(
+            *(context.validate_gene(gene) for gene in genes)
+        )
+        genes = [
+            gene for gene, ok in zip(genes, is_valid, strict=True) if ok
+        ]
+
+    # Check cache before building the (validated) request model
     cache_key = _get_search_cache_key(
-        request, include_preprints, include_cbioportal
+        chemicals,
+        diseases,
+        genes,
+        keywords,
+        variants,
+        include_preprints,
+        include_cbioportal,
     )
-    cached_result = await _search_cache.get(cache_key)
+    cached_result = _search_cache.get_nowait(cache_key)
     if cached_result is not None:
         return cached_result
 
-    # Check if we're in a search context (for reusing validated entities)
-    context = get_search_context()
-    if context and request.genes:
-        # Pre-validate genes using cached results
-        valid_genes = []
-        for gene in request.genes:
-            if await context.validate_gene(gene):
-                valid_genes.append(gene)
-        request.genes = valid_genes
-
-        # Check if we have cached cBioPortal summaries
-        if include_cbioportal and request.genes:
-            for gene in request.genes[:1]:  # Just first gene
-                summary = context.get_gene_summary(gene)
-                if summary:
-                    # We have a cached summary, can skip that part
-                    pass
+    request = PubmedRequest(
+        chemicals=chemicals,
+        diseases=diseases,
+        genes=genes,
+        keywords=keywords,
+        variants=variants,
+    )
 
     # Perform the search
     result = await search_articles_unified(
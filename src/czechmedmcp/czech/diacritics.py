@@ -1,6 +1,13 @@
 """Diacritics normalization for transparent Czech/ASCII search."""
 
+import re
 import unicodedata
+from functools import lru_cache
+
+# The Combining Diacritical Marks block (all category 'Mn'). After NFD
+# every Czech diacritic is one of these, so a single C-level regex pass
+# strips them; the per-character category check is only a fallback.
+_COMBINING_MARKS = re.compile("[\u0300-\u036f]+")
 
 
 def strip_diacritics(text: str) -> str:
@@ -19,15 +26,41 @@ def strip_diacritics(text: str) -> str:
     Returns:
         Text with diacritics removed, lowercased.
     """
-    nfkd = unicodedata.normalize("NFD", text)
-    return "".join(c for c in nfkd if unicodedata.category(c) != "Mn").lower()
+    if text.isascii():
+        return text.lower()
+    text = _COMBINING_MARKS.sub("", unicodedata.normalize("NFD", text))
+    if not text.isascii():
+        text = "".join(
+            c for c in text if unicodedata.category(c) != "Mn"
+        )
+    return text.lower()
+
+
+def normalize_text(text: str) -> str:
+    """Normalize indexed text for diacritics-insensitive matching.
+
+    Strips surrounding whitespace and diacritics and lowercases, like
+    :func:`normalize_query`, but without memoization: index builds
+    normalize many one-off labels that would only evict the query
+    strings from the cache.
+
+    Args:
+        text: Text of an indexed record.
+
+    Returns:
+        Normalized text.
+    """
+    return strip_diacritics(text.strip())
 
 
+@lru_cache(maxsize=65536)
 def normalize_query(query: str) -> str:
     """Normalize a search query for diacritics-insensitive matching.
 
-    Strips diacritics and lowercases. Use this on both the query
-    and the indexed text for transparent matching.
+    Strips diacritics and lowercases. Use this on the query and
+    :func:`normalize_text` on the indexed text for transparent
+    matching. Results are memoized, since the same query terms
+    recur across requests.
 
     Args:
         query: User search query.
@@ -35,4 +68,4 @@ def normalize_query(query: str) -> str:
     Returns:
         Normalized query string.
     """
-    return strip_diacritics(query.strip())
+    return normalize_text(query)
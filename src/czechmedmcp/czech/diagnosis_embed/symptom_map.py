@@ -7,7 +7,7 @@ descriptions ("bolest hlavy") and clinical terminology
 ("cefalea", G43/G44/R51).
 """
 
-from czechmedmcp.czech.diacritics import normalize_query
+from czechmedmcp.czech.diacritics import normalize_query, normalize_text
 
 # Each key is a normalized (lower, no diacritics) symptom
 # phrase; values are MKN-10 code prefixes that the phrase
@@ -178,7 +178,7 @@ SYMPTOM_MKN_MAP: dict[str, list[str]] = {
 
 # Pre-built normalized lookup for fast exact matching.
 _NORMALIZED_MAP: dict[str, list[str]] = {
-    normalize_query(k): v for k, v in SYMPTOM_MKN_MAP.items()
+    normalize_text(k): v for k, v in SYMPTOM_MKN_MAP.items()
 }
 
 
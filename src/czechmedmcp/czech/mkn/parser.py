@@ -2,9 +2,9 @@
 
 Downloads the official MZ ČR open data CSV and builds two
 in-memory indices:
-- code_index: maps code -> node dict (code, name_cs, kind,
+- code_index: maps code -> MknNode (code, name_cs, kind,
   parent_code, children)
-- text_index: maps normalized word -> list of codes
+- text_index: maps normalized word -> tuple of codes
 
 Results are cached using diskcache to avoid re-downloading.
 
@@ -12,18 +12,24 @@ Data source: https://data.mzcr.cz (CC BY 4.0)
 """
 
 import csv
-import io
-import json
 import logging
+import sys
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from operator import itemgetter
 
 import httpx
 
+from czechmedmcp.connection_pool import get_connection_pool
 from czechmedmcp.constants import CACHE_TTL_MONTH, CZECH_HTTP_TIMEOUT
-from czechmedmcp.czech.diacritics import normalize_query
+from czechmedmcp.czech.diacritics import normalize_text
 from czechmedmcp.http_client import (
     cache_response,
     generate_cache_key,
     get_cached_response,
+    pickle_payload,
+    unpickle_payload,
 )
 
 logger = logging.getLogger(__name__)
@@ -34,25 +40,69 @@ _MKN10_CSV_URL = (
 )
 _CACHE_TTL = CACHE_TTL_MONTH
 
+# CSV columns read by _parse_csv, in unpacking order
+_CSV_FIELDS = (
+    "kod_tecka",
+    "nazev",
+    "platnost_do",
+    "kod_kapitola_rozsah",
+    "kod_kapitola_cislo",
+    "nazev_kapitola",
+)
+
+
+@dataclass(slots=True)
+class MknNode:
+    """A chapter, block or category in the MKN-10 hierarchy."""
+
+    code: str
+    name_cs: str
+    kind: str
+    parent_code: str | None
+    children: list[str] = field(default_factory=list)
+    chapter_num: str = ""
+
+
 # Type aliases for the two index types
-CodeIndex = dict[str, dict]
-TextIndex = dict[str, list[str]]
+CodeIndex = dict[str, MknNode]
+TextIndex = dict[str, tuple[str, ...]]
 
 
 def _build_text_index(
     code: str,
     name_cs: str,
-    text_index: TextIndex,
+    text_index: defaultdict[str, list[str]],
 ) -> None:
-    """Index all words of a Czech name into the text index."""
-    normalized = normalize_query(name_cs)
+    """Index all words of a Czech name into the text index.
+
+    Codes are indexed one at a time, so a code already present in a
+    posting list is always its last entry; checking the tail keeps
+    the lists duplicate-free without scanning them.
+    """
+    normalized = normalize_text(name_cs)
     for word in normalized.split():
         if len(word) < 2:
             continue
-        if word not in text_index:
-            text_index[word] = []
-        if code not in text_index[word]:
-            text_index[word].append(code)
+        postings = text_index[word]
+        if not postings or postings[-1] != code:
+            postings.append(code)
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of text (with line endings) one at a time.
+
+    Unlike io.StringIO, this never copies the whole document: StringIO
+    widens its buffer to 4 bytes per character, so reading a multi-MB
+    CSV through it briefly costs several times the text's own size.
+    """
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start : end + 1]
+        start = end + 1
 
 
 async def _download_csv() -> str:
@@ -62,10 +112,12 @@ async def _download_csv() -> str:
     if cached:
         return cached
 
-    async with httpx.AsyncClient(timeout=CZECH_HTTP_TIMEOUT) as client:
-        resp = await client.get(_MKN10_CSV_URL)
-        resp.raise_for_status()
-        content = resp.text
+    client = await get_connection_pool(
+        True, httpx.Timeout(CZECH_HTTP_TIMEOUT)
+    )
+    resp = await client.get(_MKN10_CSV_URL, timeout=CZECH_HTTP_TIMEOUT)
+    resp.raise_for_status()
+    content = resp.text
 
     cache_response(cache_key, content, _CACHE_TTL)
     return content
@@ -81,17 +133,33 @@ def _parse_csv(  # noqa: C901 — CSV parser with many columns
     from 3-char codes, and subcategory nodes from dotted codes.
     """
     code_index: CodeIndex = {}
-    text_index: TextIndex = {}
+    text_index: defaultdict[str, list[str]] = defaultdict(list)
 
     # Track chapters and categories for hierarchy
-    chapters: dict[str, dict] = {}
+    chapters: dict[str, MknNode] = {}
     category_to_chapter: dict[str, str] = {}
 
-    reader = csv.DictReader(io.StringIO(csv_text))
+    reader = csv.reader(_iter_lines(csv_text))
+    header = next(reader, [])
+    width = len(header)
+    positions = {name: i for i, name in enumerate(header)}
+    # Pull the needed columns positionally instead of building a dict
+    # per row; columns missing from the header read an empty pad slot.
+    get_fields = itemgetter(
+        *(positions.get(name, width) for name in _CSV_FIELDS)
+    )
+
     for row in reader:
-        kod_tecka = (row.get("kod_tecka") or "").strip()
-        nazev = (row.get("nazev") or "").strip()
-        platnost_do = (row.get("platnost_do") or "").strip()
+        if len(row) <= width:
+            row.extend([""] * (width + 1 - len(row)))
+        (
+            kod_tecka,
+            nazev,
+            platnost_do,
+            chap_range,
+            chap_num,
+            chap_name,
+        ) = (value.strip() for value in get_fields(row))
 
         if not kod_tecka or not nazev:
             continue
@@ -99,25 +167,24 @@ def _parse_csv(  # noqa: C901 — CSV parser with many columns
         if platnost_do:
             continue
 
-        chap_range = (row.get("kod_kapitola_rozsah") or "").strip()
-        chap_num = (row.get("kod_kapitola_cislo") or "").strip()
-        chap_name = (row.get("nazev_kapitola") or "").strip()
+        # Chapter ranges and parent codes repeat across many rows;
+        # interning makes every node share a single string object.
+        chap_range = sys.intern(chap_range)
 
         # Register chapter if new
         if chap_range and chap_range not in chapters:
-            chapters[chap_range] = {
-                "code": chap_range,
-                "name_cs": chap_name,
-                "kind": "chapter",
-                "parent_code": None,
-                "children": [],
-                "chapter_num": chap_num,
-            }
+            chapters[chap_range] = MknNode(
+                code=chap_range,
+                name_cs=chap_name,
+                kind="chapter",
+                parent_code=None,
+                chapter_num=chap_num,
+            )
 
         # Determine kind and parent
         if "." in kod_tecka:
             kind = "category"
-            parent_code = kod_tecka.split(".")[0]
+            parent_code = sys.intern(kod_tecka.split(".")[0])
         else:
             kind = "block"
             parent_code = chap_range
@@ -126,13 +193,12 @@ def _parse_csv(  # noqa: C901 — CSV parser with many columns
         if kind == "block":
             category_to_chapter[kod_tecka] = chap_range
 
-        code_index[kod_tecka] = {
-            "code": kod_tecka,
-            "name_cs": nazev,
-            "kind": kind,
-            "parent_code": parent_code,
-            "children": [],
-        }
+        code_index[kod_tecka] = MknNode(
+            code=kod_tecka,
+            name_cs=nazev,
+            kind=kind,
+            parent_code=parent_code,
+        )
 
         if nazev:
             _build_text_index(kod_tecka, nazev, text_index)
@@ -140,52 +206,58 @@ def _parse_csv(  # noqa: C901 — CSV parser with many columns
     # Add chapter nodes to code_index
     for chap_code, chap_node in chapters.items():
         code_index[chap_code] = chap_node
-        if chap_node["name_cs"]:
+        if chap_node.name_cs:
             _build_text_index(
-                chap_code, chap_node["name_cs"], text_index
+                chap_code, chap_node.name_cs, text_index
             )
 
-    # Build children lists
+    # Build children lists. Each code is a unique dict key, so it is
+    # appended to its parent exactly once without a membership check.
     for code, node in code_index.items():
-        parent = node.get("parent_code")
+        parent = node.parent_code
         if parent and parent in code_index:
-            parent_node = code_index[parent]
-            if code not in parent_node["children"]:
-                parent_node["children"].append(code)
+            code_index[parent].children.append(code)
 
-    # Sort children for consistent ordering
+    # Sort children for consistent ordering; most nodes are leaves
+    # or have a single child and need no sort call.
     for node in code_index.values():
-        node["children"].sort()
+        if len(node.children) > 1:
+            node.children.sort()
 
     logger.debug(
         "Parsed %d MKN-10 entries, %d text tokens",
         len(code_index),
         len(text_index),
     )
-    return code_index, text_index
+    # Freeze posting lists: tuples carry no over-allocation and a
+    # smaller header, and the postings never change after parsing.
+    return code_index, {
+        word: tuple(codes) for word, codes in text_index.items()
+    }
 
 
 async def load_mkn10() -> tuple[CodeIndex, TextIndex]:
     """Download and parse MKN-10 data, with caching.
 
     Returns (code_index, text_index). Results are cached in
-    diskcache for one month.
+    diskcache for one month as a zlib-compressed pickle; the
+    in-process copy is kept by ``search._get_index``.
     """
     index_cache_key = generate_cache_key(
-        "PARSED", "mkn10:index", {}
+        "PARSED", "mkn10:index:v5", {}
     )
-    cached = get_cached_response(index_cache_key)
-    if cached:
-        payload = json.loads(cached)
-        return payload["code_index"], payload["text_index"]
-
-    csv_text = await _download_csv()
-    code_index, text_index = _parse_csv(csv_text)
-
-    payload = json.dumps(
-        {"code_index": code_index, "text_index": text_index},
-        ensure_ascii=False,
+    indices = unpickle_payload(
+        get_cached_response(index_cache_key), compress=True
     )
-    cache_response(index_cache_key, payload, _CACHE_TTL)
-
-    return code_index, text_index
+    if not isinstance(indices, tuple) or len(indices) != 2:
+        # Missing or unreadable: re-parse and overwrite the entry.
+        # Don't hold the raw CSV text past parsing: it is released
+        # before the pickled payload is built.
+        indices = _parse_csv(await _download_csv())
+        cache_response(
+            index_cache_key,
+            pickle_payload(indices, compress=True),
+            _CACHE_TTL,
+        )
+
+    return indices
@@ -12,9 +12,15 @@ MZ ČR open data CSV on first use.
 import json
 import logging
 import re
+from bisect import bisect_left
 
 from czechmedmcp.czech.diacritics import normalize_query
-from czechmedmcp.czech.mkn.parser import CodeIndex, TextIndex, load_mkn10
+from czechmedmcp.czech.mkn.parser import (
+    CodeIndex,
+    MknNode,
+    TextIndex,
+    load_mkn10,
+)
 from czechmedmcp.czech.mkn.synonyms import (
     get_prevalence_boost,
     lookup_synonym,
@@ -28,10 +34,23 @@ _CODE_RE = re.compile(
     r"|^[A-Z]\d{2}-[A-Z]\d{2}$",
     re.IGNORECASE,
 )
+# Longest string _CODE_RE can match ("A00-B99"); longer queries are
+# free text and skip the regex.
+_MAX_CODE_LEN = 7
 
 # Module-level cache for parsed indices (reset per process).
 _INDEX_CACHE: tuple[CodeIndex, TextIndex] | None = None
 
+# Suffix array over the text index vocabulary, tagged with the
+# text index it was built from.
+_SUFFIX_CACHE: tuple[TextIndex, list[str], list[str]] | None = None
+
+# (chapter, chapter_name, block, block_name, category) per code.
+_Ancestry = tuple[str, str, str, str, str]
+
+# Memoized ancestry, tagged with the code index it was built from.
+_ANCESTRY_CACHE: tuple[CodeIndex, dict[str, _Ancestry]] | None = None
+
 
 async def _get_index() -> tuple[CodeIndex, TextIndex]:
     """Return cached or freshly loaded (code_index, text_index)."""
@@ -41,43 +60,57 @@ async def _get_index() -> tuple[CodeIndex, TextIndex]:
     return _INDEX_CACHE
 
 
+def _ancestry(
+    node: MknNode,
+    code_index: CodeIndex,
+    memo: dict[str, _Ancestry],
+) -> _Ancestry:
+    """Chapter/block/category of ``node`` and its ancestors.
+
+    Each node reuses its parent's memoized entry, so resolving any
+    code costs at most one step per uncached ancestor.
+    """
+    cached = memo.get(node.code)
+    if cached is not None:
+        return cached
+
+    parent = (
+        code_index.get(node.parent_code) if node.parent_code else None
+    )
+    chapter_code, chapter_name, block_code, block_name, category_code = (
+        _ancestry(parent, code_index, memo)
+        if parent is not None
+        else ("", "", "", "", "")
+    )
+    if node.kind == "chapter":
+        chapter_code, chapter_name = node.code, node.name_cs
+    elif node.kind == "block":
+        block_code, block_name = node.code, node.name_cs
+    elif node.kind == "category":
+        category_code = node.code
+
+    result = (
+        chapter_code, chapter_name, block_code, block_name, category_code
+    )
+    memo[node.code] = result
+    return result
+
+
 def _resolve_hierarchy(
     code: str,
     code_index: CodeIndex,
 ) -> dict | None:
-    """Walk up parent links to resolve chapter/block/category."""
+    """Resolve chapter/block/category from memoized parent links."""
+    global _ANCESTRY_CACHE
     node = code_index.get(code)
     if node is None:
         return None
 
-    chapter_code = ""
-    chapter_name = ""
-    block_code = ""
-    block_name = ""
-    category_code = ""
-
-    current = node
-    chain: list[dict] = [current]
-    while current.get("parent_code"):
-        parent = code_index.get(current["parent_code"])
-        if parent is None:
-            break
-        chain.append(parent)
-        current = parent
-
-    for ancestor in reversed(chain):
-        kind = ancestor.get("kind", "")
-        if kind == "chapter":
-            chapter_code = ancestor["code"]
-            chapter_name = ancestor.get("name_cs", "")
-        elif kind == "block":
-            block_code = ancestor["code"]
-            block_name = ancestor.get("name_cs", "")
-        elif kind == "category":
-            category_code = ancestor["code"]
-
-    if node.get("kind") == "category" and not category_code:
-        category_code = node["code"]
+    if _ANCESTRY_CACHE is None or _ANCESTRY_CACHE[0] is not code_index:
+        _ANCESTRY_CACHE = (code_index, {})
+    chapter_code, chapter_name, block_code, block_name, category_code = (
+        _ancestry(node, code_index, _ANCESTRY_CACHE[1])
+    )
 
     if not chapter_code:
         return None
@@ -103,8 +136,8 @@ def _node_to_diagnosis(
     hierarchy = _resolve_hierarchy(code, code_index)
 
     return {
-        "code": node["code"],
-        "name_cs": node.get("name_cs", ""),
+        "code": node.code,
+        "name_cs": node.name_cs,
         "name_en": None,
         "definition": None,
         "hierarchy": hierarchy,
@@ -119,10 +152,10 @@ def _search_by_code(
     query: str,
     code_index: CodeIndex,
     max_results: int,
-) -> list[dict]:
+) -> list[MknNode]:
     """Return nodes whose code starts with the query prefix."""
     upper_q = query.upper()
-    results = []
+    results: list[MknNode] = []
     for code, node in code_index.items():
         if code.upper().startswith(upper_q):
             results.append(node)
@@ -131,12 +164,56 @@ def _search_by_code(
     return results
 
 
+def _get_suffix_index(
+    text_index: TextIndex,
+) -> tuple[list[str], list[str]]:
+    """Return (sorted suffixes, owning word) for all indexed words.
+
+    Built on first use per text index. Substring lookups then bisect
+    into the sorted suffixes instead of scanning the vocabulary.
+    """
+    global _SUFFIX_CACHE
+    if _SUFFIX_CACHE is None or _SUFFIX_CACHE[0] is not text_index:
+        pairs = sorted(
+            (word[i:], word)
+            for word in text_index
+            for i in range(len(word))
+        )
+        suffixes = [suffix for suffix, _ in pairs]
+        owners = [word for _, word in pairs]
+        _SUFFIX_CACHE = (text_index, suffixes, owners)
+    return _SUFFIX_CACHE[1], _SUFFIX_CACHE[2]
+
+
+def _match_word(
+    word: str,
+    text_index: TextIndex,
+    suffixes: list[str],
+    owners: list[str],
+) -> set[str]:
+    """Codes of indexed words containing, or contained in, ``word``."""
+    matching: set[str] = set()
+    # Indexed words containing the query word: each has a suffix
+    # starting with it, and those suffixes sort next to each other.
+    i = bisect_left(suffixes, word)
+    while i < len(suffixes) and suffixes[i].startswith(word):
+        matching.update(text_index[owners[i]])
+        i += 1
+    # Indexed words contained in the query word (min length 2).
+    for start in range(len(word) - 1):
+        for end in range(start + 2, len(word) + 1):
+            codes = text_index.get(word[start:end])
+            if codes:
+                matching.update(codes)
+    return matching
+
+
 def _search_by_text(
     query: str,
     code_index: CodeIndex,
     text_index: TextIndex,
     max_results: int,
-) -> list[dict]:
+) -> list[MknNode]:
     """Full-text search using the inverted text index."""
     normalized = normalize_query(query)
     words = [w for w in normalized.split() if len(w) >= 2]
@@ -144,13 +221,11 @@ def _search_by_text(
     if not words:
         return []
 
-    candidate_sets: list[set[str]] = []
-    for word in words:
-        matching: set[str] = set()
-        for indexed_word, codes in text_index.items():
-            if word in indexed_word or indexed_word in word:
-                matching.update(codes)
-        candidate_sets.append(matching)
+    suffixes, owners = _get_suffix_index(text_index)
+
+    candidate_sets = [
+        _match_word(word, text_index, suffixes, owners) for word in words
+    ]
 
     if not candidate_sets:
         return []
@@ -167,8 +242,8 @@ def _search_by_text(
 
     results.sort(
         key=lambda n: (
-            -get_prevalence_boost(n["code"]),
-            n["code"],
+            -get_prevalence_boost(n.code),
+            n.code,
         ),
     )
     return results[:max_results]
@@ -198,14 +273,14 @@ async def _mkn_search(
         )
 
     stripped = query.strip()
-    if _CODE_RE.match(stripped):
+    if len(stripped) <= _MAX_CODE_LEN and _CODE_RE.match(stripped):
         nodes = _search_by_code(
             stripped, code_index, max_results
         )
     else:
         # Check synonym dictionary first (T045).
         synonym_codes = lookup_synonym(stripped)
-        synonym_nodes: list[dict] = []
+        synonym_nodes: list[MknNode] = []
         if synonym_codes:
             for sc in synonym_codes:
                 node = code_index.get(sc)
@@ -218,19 +293,19 @@ async def _mkn_search(
 
         # Merge: synonyms first, then text results.
         seen: set[str] = {
-            n["code"] for n in synonym_nodes
+            n.code for n in synonym_nodes
         }
         for tn in text_nodes:
-            if tn["code"] not in seen:
+            if tn.code not in seen:
                 synonym_nodes.append(tn)
-                seen.add(tn["code"])
+                seen.add(tn.code)
         nodes = synonym_nodes[:max_results]
 
     results = [
         {
-            "code": n["code"],
-            "name_cs": n.get("name_cs", ""),
-            "kind": n.get("kind", ""),
+            "code": n.code,
+            "name_cs": n.name_cs,
+            "kind": n.kind,
         }
         for n in nodes
     ]
@@ -300,17 +375,19 @@ async def _mkn_browse(
         )
 
     if code is None:
+        chapter_nodes = sorted(
+            (n for n in code_index.values() if n.kind == "chapter"),
+            key=lambda n: n.code,
+        )
         chapters = [
             {
-                "code": node["code"],
-                "name_cs": node.get("name_cs", ""),
-                "kind": node.get("kind", ""),
-                "children_count": len(node.get("children", [])),
+                "code": node.code,
+                "name_cs": node.name_cs,
+                "kind": node.kind,
+                "children_count": len(node.children),
             }
-            for node in code_index.values()
-            if node.get("kind") == "chapter"
+            for node in chapter_nodes
         ]
-        chapters.sort(key=lambda n: n["code"])
         return json.dumps(
             {"type": "chapters", "items": chapters},
             ensure_ascii=False,
@@ -324,23 +401,21 @@ async def _mkn_browse(
         )
 
     child_nodes = []
-    for child_code in node.get("children", []):
+    for child_code in node.children:
         child = code_index.get(child_code)
         if child:
             child_nodes.append({
-                "code": child["code"],
-                "name_cs": child.get("name_cs", ""),
-                "kind": child.get("kind", ""),
-                "children_count": len(
-                    child.get("children", [])
-                ),
+                "code": child.code,
+                "name_cs": child.name_cs,
+                "kind": child.kind,
+                "children_count": len(child.children),
             })
 
     result = {
-        "code": node["code"],
-        "name_cs": node.get("name_cs", ""),
-        "kind": node.get("kind", ""),
-        "parent_code": node.get("parent_code"),
+        "code": node.code,
+        "name_cs": node.name_cs,
+        "kind": node.kind,
+        "parent_code": node.parent_code,
         "children": child_nodes,
     }
     return json.dumps(result, ensure_ascii=False)
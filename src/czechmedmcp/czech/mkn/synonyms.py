@@ -12,7 +12,7 @@ Two complementary lookup mechanisms:
    ``match_symptom_clusters()`` returns strong candidates.
 """
 
-from czechmedmcp.czech.diacritics import normalize_query
+from czechmedmcp.czech.diacritics import normalize_query, normalize_text
 
 # ---------------------------------------------------------
 # Czech colloquial term → ICD-10 code dictionary
@@ -236,7 +236,7 @@ DIRECT_DIAGNOSIS_KEYWORDS: dict[str, str] = {
 
 # Pre-built normalized lookup for direct keywords.
 _NORMALIZED_DIRECT: dict[str, str] = {
-    normalize_query(k): v for k, v in DIRECT_DIAGNOSIS_KEYWORDS.items()
+    normalize_text(k): v for k, v in DIRECT_DIAGNOSIS_KEYWORDS.items()
 }
 
 
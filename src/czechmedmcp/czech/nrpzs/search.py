@@ -10,19 +10,24 @@ import csv
 import io
 import json
 import logging
+import sys
+from dataclasses import dataclass
 
 import httpx
 
+from czechmedmcp.connection_pool import get_connection_pool
 from czechmedmcp.constants import (
     BULK_DOWNLOAD_TIMEOUT,
     CACHE_TTL_DAY,
     compute_skip,
 )
-from czechmedmcp.czech.diacritics import normalize_query
+from czechmedmcp.czech.diacritics import normalize_query, normalize_text
 from czechmedmcp.http_client import (
     cache_response,
     generate_cache_key,
     get_cached_response,
+    pickle_payload,
+    unpickle_payload,
 )
 from czechmedmcp.utils.retry import async_retry
 
@@ -35,8 +40,41 @@ _NRPZS_CSV_URL = (
 )
 _CSV_CACHE_TTL = CACHE_TTL_DAY
 
+# Low-cardinality columns whose values repeat across thousands of rows.
+_INTERNED_COLUMNS = (
+    "ZZ_obec",
+    "ZZ_kraj_nazev",
+    "ZZ_okres_nazev",
+    "ZZ_druh_nazev",
+    "ZZ_druh_pece",
+    "ZZ_forma_pece",
+    "ZZ_obor_pece",
+    "poskytovatel_pravni_forma_nazev",
+)
+
+
+@dataclass(slots=True)
+class _SearchColumns:
+    """Normalized search fields of ``_PROVIDERS``, one list per column.
+
+    Entry ``i`` of every list belongs to ``rows[i]``, so a search scans
+    flat lists of pre-normalized strings and only touches the row dicts
+    it returns. ``by_id`` and ``by_ico`` map facility ID and ICO to the
+    first row carrying them, for direct detail lookups.
+    """
+
+    rows: list[dict]
+    names: list[str]
+    providers: list[str]
+    cities: list[str]
+    specialties: list[str]
+    by_id: dict[str, dict]
+    by_ico: dict[str, dict]
+
+
 # Module-level cache
 _PROVIDERS: list[dict] | None = None
+_COLUMNS: _SearchColumns | None = None
 
 
 async def _download_csv() -> str:
@@ -47,13 +85,16 @@ async def _download_csv() -> str:
         return cached
 
     async def _do_download() -> str:
-        async with httpx.AsyncClient(
+        client = await get_connection_pool(
+            True, httpx.Timeout(BULK_DOWNLOAD_TIMEOUT)
+        )
+        resp = await client.get(
+            _NRPZS_CSV_URL,
             timeout=BULK_DOWNLOAD_TIMEOUT,
             follow_redirects=True,
-        ) as client:
-            resp = await client.get(_NRPZS_CSV_URL)
-            resp.raise_for_status()
-            return resp.text
+        )
+        resp.raise_for_status()
+        return resp.text
 
     content = await async_retry(
         _do_download, max_retries=3, initial_delay=2.0
@@ -68,22 +109,87 @@ def _parse_csv(csv_text: str) -> list[dict]:
     reader = csv.DictReader(io.StringIO(csv_text))
     providers = []
     for row in reader:
+        # Share one string object per distinct value; pickle then
+        # also writes each value once.
+        for column in _INTERNED_COLUMNS:
+            value = row.get(column)
+            if value:
+                row[column] = sys.intern(value)
         providers.append(row)
     return providers
 
 
 async def _get_providers() -> list[dict]:
-    """Return cached or freshly loaded provider list."""
-    global _PROVIDERS
+    """Return cached or freshly loaded provider list.
+
+    The parsed rows and their search columns are pickled to
+    diskcache, so a new process skips the CSV parse entirely.
+    """
+    global _PROVIDERS, _COLUMNS
     if _PROVIDERS is not None:
         return _PROVIDERS
 
-    csv_text = await _download_csv()
-    _PROVIDERS = _parse_csv(csv_text)
+    parsed_cache_key = generate_cache_key(
+        "PARSED", "nrpzs:providers:v2", {}
+    )
+    cached = unpickle_payload(get_cached_response(parsed_cache_key))
+    if isinstance(cached, _SearchColumns):
+        _COLUMNS = cached
+        _PROVIDERS = cached.rows
+    else:
+        # Missing or unreadable: re-parse and overwrite the entry.
+        providers = _parse_csv(await _download_csv())
+        columns = _get_search_columns(providers)
+        cache_response(
+            parsed_cache_key,
+            pickle_payload(columns),
+            _CSV_CACHE_TTL,
+        )
+        _PROVIDERS = providers
+
     logger.debug("Loaded %d NRPZS providers", len(_PROVIDERS))
     return _PROVIDERS
 
 
+def _get_search_columns(providers: list[dict]) -> _SearchColumns:
+    """Return normalized search columns for ``providers``.
+
+    Built once per provider list; rebuilt only if the list is replaced.
+    """
+    global _COLUMNS
+    if _COLUMNS is None or _COLUMNS.rows is not providers:
+        _COLUMNS = _SearchColumns(
+            rows=providers,
+            names=[
+                normalize_text(r.get("ZZ_nazev", ""))
+                for r in providers
+            ],
+            providers=[
+                normalize_text(r.get("poskytovatel_nazev", ""))
+                for r in providers
+            ],
+            cities=[
+                normalize_text(r.get("ZZ_obec", ""))
+                for r in providers
+            ],
+            specialties=[
+                normalize_text(r.get("ZZ_obor_pece", ""))
+                for r in providers
+            ],
+            by_id=_first_row_by(providers, "ZZ_misto_poskytovani_ID"),
+            by_ico=_first_row_by(providers, "poskytovatel_ICO"),
+        )
+    return _COLUMNS
+
+
+def _first_row_by(providers: list[dict], column: str) -> dict[str, dict]:
+    """Map each stripped value of ``column`` to its first row."""
+    index: dict[str, dict] = {}
+    for row in providers:
+        index.setdefault(str(row.get(column, "")).strip(), row)
+    return index
+
+
 def _csv_to_summary(row: dict) -> dict:
     """Convert a CSV row to ProviderSummary dict."""
     specialties_str = row.get("ZZ_obor_pece", "")
@@ -167,37 +273,26 @@ def _csv_to_provider(row: dict) -> dict:
 
 
 def _matches_query(
-    row: dict,
+    columns: _SearchColumns,
+    i: int,
     query_n: str | None,
     city_n: str | None,
     specialty_n: str | None,
 ) -> bool:
-    """Check if a CSV row matches the search criteria."""
-    if query_n:
-        name_n = normalize_query(
-            row.get("ZZ_nazev", "")
-        )
-        prov_n = normalize_query(
-            row.get("poskytovatel_nazev", "")
-        )
-        if query_n not in name_n and query_n not in prov_n:
-            return False
-
-    if city_n:
-        row_city = normalize_query(
-            row.get("ZZ_obec", "")
-        )
-        if city_n not in row_city:
-            return False
+    """Check if provider ``i`` matches the search criteria."""
+    if (
+        query_n
+        and query_n not in columns.names[i]
+        and query_n not in columns.providers[i]
+    ):
+        return False
 
-    if specialty_n:
-        spec_n = normalize_query(
-            row.get("ZZ_obor_pece", "")
-        )
-        if specialty_n not in spec_n:
-            return False
+    if city_n and city_n not in columns.cities[i]:
+        return False
 
-    return True
+    return not (
+        specialty_n and specialty_n not in columns.specialties[i]
+    )
 
 
 async def _nrpzs_search(
@@ -245,8 +340,9 @@ async def _nrpzs_search(
     matches: list[dict] = []
     total = 0
 
-    for row in providers:
-        if _matches_query(row, query_n, city_n, specialty_n):
+    columns = _get_search_columns(providers)
+    for i, row in enumerate(providers):
+        if _matches_query(columns, i, query_n, city_n, specialty_n):
             total += 1
             if total > skip and len(matches) < page_size:
                 matches.append(_csv_to_summary(row))
@@ -285,36 +381,22 @@ async def _nrpzs_get(provider_id: str) -> str:
         )
 
     query = str(provider_id).strip()
+    columns = _get_search_columns(providers)
 
-    # 1. Exact match on facility ID
-    for row in providers:
-        row_id = str(
-            row.get("ZZ_misto_poskytovani_ID", "")
-        ).strip()
-        if row_id == query:
-            return json.dumps(
-                _csv_to_provider(row),
-                ensure_ascii=False,
-            )
-
-    # 2. Exact match on ICO
-    for row in providers:
-        row_ico = str(
-            row.get("poskytovatel_ICO", "")
-        ).strip()
-        if row_ico == query:
-            return json.dumps(
-                _csv_to_provider(row),
-                ensure_ascii=False,
-            )
+    # 1. Exact match on facility ID, then 2. on ICO
+    row = columns.by_id.get(query)
+    if row is None:
+        row = columns.by_ico.get(query)
+    if row is not None:
+        return json.dumps(
+            _csv_to_provider(row),
+            ensure_ascii=False,
+        )
 
     # 3. Substring match on facility name
     query_n = normalize_query(query)
     if query_n:
-        for row in providers:
-            name_n = normalize_query(
-                row.get("ZZ_nazev", "")
-            )
+        for row, name_n in zip(providers, columns.names, strict=True):
             if query_n in name_n:
                 return json.dumps(
                     _csv_to_provider(row),
@@ -0,0 +1,110 @@
+"""Substring search over pre-normalized row fields.
+
+Shared by the SZV and VZP codebooks, which both keep their rows in
+memory and match a query against a few normalized columns per row.
+Each module passes in its own field extractors and keeps its own
+module-level ``SearchColumns`` instance.
+"""
+
+import sys
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+
+# Terminates every field in SearchColumns.text so no match spans two.
+FIELD_SEP = "\x00"
+
+RowField = Callable[[dict], str]
+
+
+@dataclass(slots=True)
+class SearchColumns:
+    """Normalized search fields of a row list.
+
+    ``text`` joins the normalized fields of every row, each followed
+    by ``FIELD_SEP``, and ``rows[i]`` starts at ``starts[i]``; one
+    ``str.find`` over it replaces a per-row loop, and a search only
+    touches the rows it returns. ``by_code`` maps each stripped,
+    lowercased code to its first row, for direct detail lookups.
+    """
+
+    rows: list[dict]
+    text: str
+    starts: list[int]
+    by_code: dict[str, dict]
+
+
+def build_search_columns(
+    rows: list[dict],
+    code: RowField,
+    fields: Sequence[RowField],
+) -> SearchColumns:
+    """Build search columns for ``rows``.
+
+    Args:
+        rows: Parsed source rows.
+        code: Returns the raw code of a row, used for ``by_code``.
+        fields: Return the normalized searchable fields of a row.
+    """
+    text, starts = _join_rows(rows, fields)
+    by_code: dict[str, dict] = {}
+    for row in rows:
+        by_code.setdefault(code(row).strip().lower(), row)
+    return SearchColumns(
+        rows=rows,
+        text=text,
+        starts=starts,
+        by_code=by_code,
+    )
+
+
+def intern_columns(row: dict, columns: Iterable[str]) -> None:
+    """Intern the string values of low-cardinality ``columns``.
+
+    Rows then share one string object per distinct value, and pickle
+    also writes each value once.
+    """
+    for column in columns:
+        value = row.get(column)
+        if isinstance(value, str):
+            row[column] = sys.intern(value)
+
+
+def _join_rows(
+    rows: list[dict], fields: Sequence[RowField],
+) -> tuple[str, list[int]]:
+    """Join per-row fields into one text and its row start offsets."""
+    parts: list[str] = []
+    starts: list[int] = []
+    offset = 0
+    for raw in rows:
+        row = "".join(f(raw) + FIELD_SEP for f in fields)
+        starts.append(offset)
+        parts.append(row)
+        offset += len(row)
+    return "".join(parts), starts
+
+
+def matching_rows(
+    columns: SearchColumns, normalized_q: str, limit: int,
+) -> list[int]:
+    """Return indices of the first ``limit`` matching rows.
+
+    Jumps between hits with ``str.find`` on the joined text instead
+    of testing each row; rows come back in list order. No field
+    contains ``FIELD_SEP``, so a query containing it matches nothing.
+    """
+    starts = columns.starts
+    if not starts or FIELD_SEP in normalized_q:
+        return []
+
+    text = columns.text
+    rows: list[int] = []
+    pos = text.find(normalized_q)
+    while pos != -1:
+        row = bisect_right(starts, pos) - 1
+        rows.append(row)
+        if len(rows) >= limit or row + 1 == len(starts):
+            break
+        pos = text.find(normalized_q, starts[row + 1])
+    return rows
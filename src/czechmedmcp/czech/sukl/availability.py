@@ -20,15 +20,14 @@ from czechmedmcp.constants import CACHE_TTL_HOUR
 from czechmedmcp.czech.sukl.client import (
     SUKL_DLP_V1,
     SUKL_HTTP_TIMEOUT,
+    cache_json,
+    get_cached_json,
+    get_sukl_client,
 )
 from czechmedmcp.czech.sukl.client import (
     fetch_drug_detail as _fetch_drug_detail,
 )
-from czechmedmcp.http_client import (
-    cache_response,
-    generate_cache_key,
-    get_cached_response,
-)
+from czechmedmcp.http_client import generate_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -46,29 +45,23 @@ async def _check_distribution(sukl_code: str) -> str:
     url = f"{SUKL_DLP_V1}/vpois/{sukl_code}"
     cache_key = generate_cache_key("GET", url, {})
 
-    cached = get_cached_response(cache_key)
-    if cached:
-        data = json.loads(cached)
-        if data.get("_status"):
-            return data["_status"]
+    data = await get_cached_json(cache_key, _CACHE_TTL)
+    if data and data.get("_status"):
+        return data["_status"]
 
     try:
-        async with httpx.AsyncClient(timeout=SUKL_HTTP_TIMEOUT) as client:
-            resp = await client.get(url)
-            if resp.status_code == 404:
-                status = "unavailable"
-            elif resp.is_success:
-                status = "available"
-            else:
-                status = "unavailable"
+        client = await get_sukl_client()
+        resp = await client.get(url, timeout=SUKL_HTTP_TIMEOUT)
+        if resp.status_code == 404:
+            status = "unavailable"
+        elif resp.is_success:
+            status = "available"
+        else:
+            status = "unavailable"
     except httpx.HTTPError:
         status = "unavailable"
 
-    cache_response(
-        cache_key,
-        json.dumps({"_status": status}),
-        _CACHE_TTL,
-    )
+    await cache_json(cache_key, {"_status": status}, _CACHE_TTL)
     return status
 
 
@@ -82,14 +75,16 @@ async def _sukl_availability_check(sukl_code: str) -> str:
         JSON with sukl_code, name, status, last_checked, note,
         source
     """
-    detail = await _fetch_drug_detail(sukl_code)
+    detail, status = await asyncio.gather(
+        _fetch_drug_detail(sukl_code),
+        _check_distribution(sukl_code),
+    )
     if not detail:
         return json.dumps(
             {"error": f"Drug not found: {sukl_code}"},
             ensure_ascii=False,
         )
 
-    status = await _check_distribution(sukl_code)
     now = datetime.now(timezone.utc).isoformat()
 
     return json.dumps(
@@ -124,11 +119,13 @@ async def _batch_availability(sukl_codes: list[str]) -> str:
 
     async def _check_one(code: str) -> BatchAvailabilityItem:
         try:
-            detail = await _fetch_drug_detail(code)
+            detail, status = await asyncio.gather(
+                _fetch_drug_detail(code),
+                _check_distribution(code),
+            )
             name = (
                 detail.get("nazev") if detail else None
             )
-            status = await _check_distribution(code)
             return BatchAvailabilityItem(
                 sukl_code=code,
                 name=name,
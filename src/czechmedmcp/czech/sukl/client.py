@@ -1,14 +1,20 @@
 """Shared SUKL DLP API client utilities.
 
-Provides the base URL constant and a single _fetch_drug_detail
-implementation used by search, getter, and availability modules.
+Provides the base URL constant, the pooled HTTP client, the parsed
+response cache, and a single _fetch_drug_detail implementation used
+by search, getter, and availability modules.
 """
 
+import asyncio
 import json
 import logging
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any, TypeVar
 
 import httpx
 
+from czechmedmcp.connection_pool import get_connection_pool
 from czechmedmcp.constants import (
     CZECH_HTTP_TIMEOUT,
     DEFAULT_CACHE_TIMEOUT,
@@ -19,6 +25,7 @@ from czechmedmcp.http_client import (
     generate_cache_key,
     get_cached_response,
 )
+from czechmedmcp.utils.request_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +33,24 @@ SUKL_DLP_V1 = f"{SUKL_API_URL.removesuffix('/api')}/v1"
 SUKL_HTTP_TIMEOUT = CZECH_HTTP_TIMEOUT
 _DEFAULT_CACHE_TTL = DEFAULT_CACHE_TIMEOUT
 
+# Parsed payloads of recently used responses, so repeat lookups of
+# the same drug skip the disk read and the JSON parse. Entries are
+# kept for at most the disk TTL, capped at _PARSED_CACHE_TTL.
+#
+# The dicts and lists are handed to every caller as-is. Callers only
+# read them and build new models or dicts from them; nothing in this
+# package may mutate a payload returned by get_cached_json or the
+# fetch helpers (see test_sukl_http_paths.TestParsedCacheSharing).
+_PARSED_CACHE = LRUCache(max_size=1024)
+_PARSED_CACHE_TTL = 900
+
+# Fetches currently on the wire, keyed by cache key. Concurrent
+# callers for the same key (e.g. the drug profile sections) await
+# one request instead of each issuing their own.
+_INFLIGHT: dict[str, asyncio.Future[Any]] = {}
+
+T = TypeVar("T")
+
 
 def normalize_sukl_code(code: str) -> str:
     """Normalize a SUKL code to 7-digit zero-padded format.
@@ -36,6 +61,55 @@ def normalize_sukl_code(code: str) -> str:
     return code.strip().zfill(7)
 
 
+async def get_sukl_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client for SUKL requests.
+
+    The client comes from the shared per-event-loop connection pool,
+    so keep-alive connections to the SUKL hosts are reused across
+    calls. Pass ``timeout=`` on each request.
+    """
+    return await get_connection_pool(
+        True, httpx.Timeout(SUKL_HTTP_TIMEOUT)
+    )
+
+
+async def get_cached_json(cache_key: str, ttl: int) -> Any | None:
+    """Return a disk-cached JSON payload, parsing it once per process.
+
+    ``ttl`` is the TTL the entry was stored with; the parsed object is
+    kept for no longer than that. The result is shared and read-only.
+    """
+    data = _PARSED_CACHE.get_nowait(cache_key)
+    if data is None:
+        cached = get_cached_response(cache_key)
+        if not cached:
+            return None
+        data = json.loads(cached)
+        await _PARSED_CACHE.set(
+            cache_key, data, min(ttl, _PARSED_CACHE_TTL)
+        )
+    return data
+
+
+async def cache_json(cache_key: str, data: Any, ttl: int) -> None:
+    """Store a JSON payload on disk and keep the parsed object."""
+    cache_response(cache_key, json.dumps(data), ttl)
+    await _PARSED_CACHE.set(cache_key, data, min(ttl, _PARSED_CACHE_TTL))
+
+
+async def single_flight(
+    key: str, fetch: Callable[[], Awaitable[T]]
+) -> T:
+    """Run ``fetch`` once for all concurrent callers of ``key``."""
+    pending = _INFLIGHT.get(key)
+    if pending is None:
+        pending = asyncio.ensure_future(fetch())
+        _INFLIGHT[key] = pending
+        pending.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # Shielded so one caller's cancellation does not fail the others.
+    return await asyncio.shield(pending)
+
+
 async def fetch_drug_detail(
     sukl_code: str,
     use_cache: bool = True,
@@ -53,19 +127,38 @@ async def fetch_drug_detail(
     cache_key = generate_cache_key("GET", url, {})
 
     if use_cache:
-        cached = get_cached_response(cache_key)
+        cached = await get_cached_json(cache_key, cache_ttl)
         if cached:
-            return json.loads(cached)
+            return cached
+
+    return await single_flight(
+        cache_key,
+        partial(
+            _download_drug_detail,
+            sukl_code,
+            url,
+            cache_key,
+            use_cache,
+            cache_ttl,
+        ),
+    )
+
 
+async def _download_drug_detail(
+    sukl_code: str,
+    url: str,
+    cache_key: str,
+    use_cache: bool,
+    cache_ttl: int,
+) -> dict | None:
+    """Fetch one drug detail from the API and cache it."""
     try:
-        async with httpx.AsyncClient(
-            timeout=SUKL_HTTP_TIMEOUT
-        ) as client:
-            resp = await client.get(url)
-            if resp.status_code == 404:
-                return None
-            resp.raise_for_status()
-            data = resp.json()
+        client = await get_sukl_client()
+        resp = await client.get(url, timeout=SUKL_HTTP_TIMEOUT)
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+        data = resp.json()
     except httpx.HTTPError:
         logger.warning(
             "Failed to fetch drug detail for %s", sukl_code
@@ -73,5 +166,5 @@ async def fetch_drug_detail(
         return None
 
     if use_cache:
-        cache_response(cache_key, json.dumps(data), cache_ttl)
+        await cache_json(cache_key, data, cache_ttl)
     return data
@@ -4,28 +4,44 @@ Builds a lazy-loaded index from cached drug details (~14 MB),
 refreshed daily (CACHE_TTL_DAY). Follows the same on-demand
 initialization pattern as MKN-10 and SZV modules.
 
-Persistent disk cache: after a successful build the serialised
-index is written to diskcache so that subsequent process starts
-load in ~1 s instead of re-fetching ~68 K drug details (~10 min).
+Substring search goes through a trigram posting index: every
+three-character slice of an entry's searchable text maps to the
+ascending positions of the entries containing it, so a query only
+verifies entries that hold all of its trigrams.
+
+Daily refreshes are generational: the index remembers a revision
+(digest of the SUKL code list) and, when a refresh finds the list
+unchanged, keeps its entries instead of re-fetching every detail.
+A full fetch is still forced once the entries are older than the
+detail cache TTL.
+
+Persistent disk cache: after a successful build the entries, their
+trigram postings and the revision are pickled to diskcache so that
+subsequent process starts load in well under a second instead of
+re-fetching ~68 K drug details (~10 min).
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import pickle
 import time
-from dataclasses import asdict, dataclass
-
-import httpx
+from array import array
+from dataclasses import dataclass, fields
+from operator import attrgetter
 
 from czechmedmcp.constants import (
     BULK_DOWNLOAD_TIMEOUT,
     CACHE_TTL_DAY,
+    DEFAULT_CACHE_TIMEOUT,
     compute_skip,
 )
-from czechmedmcp.czech.diacritics import normalize_query
+from czechmedmcp.czech.diacritics import normalize_query, normalize_text
 from czechmedmcp.czech.sukl.client import (
     SUKL_DLP_V1,
     fetch_drug_detail,
+    get_sukl_client,
 )
 from czechmedmcp.http_client import (
     cache_response,
@@ -37,7 +53,10 @@ from czechmedmcp.utils.retry import async_retry
 logger = logging.getLogger(__name__)
 
 _INDEX_CACHE_TTL = CACHE_TTL_DAY
-_INDEX_DISK_KEY = "sukl_drug_index_v1"
+_INDEX_DISK_KEY = "sukl_drug_index_v4"
+# Entries older than the detail cache are re-fetched even when the
+# code list is unchanged, so detail edits still reach the index.
+_MAX_ENTRY_AGE = DEFAULT_CACHE_TIMEOUT
 _MIN_SUCCESS_RATIO = 0.50  # build succeeds if >= 50% fetched
 
 
@@ -57,6 +76,17 @@ class DrugIndexEntry:
     holder_code: str
 
 
+# Entries are persisted as plain field tuples: unpickling a frozen
+# dataclass goes through a per-field setattr and is slower than
+# calling the constructor positionally.
+_entry_row = attrgetter(*(f.name for f in fields(DrugIndexEntry)))
+
+_Postings = dict[str, "array[int]"]
+_GRAM = 3
+# Past this share of the index, scanning beats intersecting postings.
+_DENSE_FRACTION = 4
+
+
 class DrugIndex:
     """In-memory searchable drug index singleton."""
 
@@ -66,6 +96,13 @@ class DrugIndex:
         self._lock = asyncio.Lock()
         self._rebuilding = False
         self._rebuild_task: asyncio.Task | None = None
+        # Trigram postings, tagged with the entry list they index.
+        self._postings: (
+            tuple[list[DrugIndexEntry], _Postings] | None
+        ) = None
+        # Revision of the code list the entries were fetched for.
+        self._revision = ""
+        self._fetched_at: float = 0.0
 
     @property
     def is_expired(self) -> bool:
@@ -123,13 +160,15 @@ class DrugIndex:
         Falls back to live API fetch with partial-build tolerance.
         """
         # 1. Try persistent disk cache
-        cached_json = get_cached_response(_INDEX_DISK_KEY)
-        if cached_json:
+        cached = get_cached_response(_INDEX_DISK_KEY)
+        if isinstance(cached, bytes):
             try:
-                raw = json.loads(cached_json)
-                self._entries = [
-                    DrugIndexEntry(**e) for e in raw
-                ]
+                payload = pickle.loads(cached)  # noqa: S301
+                rows, postings, revision, fetched_at = payload
+                self._entries = [DrugIndexEntry(*r) for r in rows]
+                self._postings = (self._entries, postings)
+                self._revision = revision
+                self._fetched_at = fetched_at
                 self._built_at = time.time()
                 logger.info(
                     "SUKL drug index loaded from cache: "
@@ -158,6 +197,20 @@ class DrugIndex:
             logger.error("Drug list is empty")
             return
 
+        revision = _list_revision(codes)
+        if (
+            self._entries
+            and revision == self._revision
+            and time.time() - self._fetched_at < _MAX_ENTRY_AGE
+        ):
+            self._built_at = time.time()
+            self._persist()
+            logger.info(
+                "SUKL drug list unchanged — keeping %d entries",
+                len(self._entries),
+            )
+            return
+
         entries = await _fetch_all_details(codes)
 
         ratio = len(entries) / len(codes) if codes else 0
@@ -176,15 +229,17 @@ class DrugIndex:
 
         self._entries = entries
         self._built_at = time.time()
+        # Only a complete fetch may be kept for an unchanged list; a
+        # partial one is refetched on the next refresh.
+        if len(entries) == len(codes):
+            self._fetched_at = self._built_at
+            self._revision = revision
+        else:
+            self._fetched_at = 0.0
+            self._revision = ""
 
         # 3. Persist to disk cache
-        serialised = json.dumps(
-            [asdict(e) for e in entries],
-            ensure_ascii=False,
-        )
-        cache_response(
-            _INDEX_DISK_KEY, serialised, _INDEX_CACHE_TTL
-        )
+        self._persist()
 
         elapsed = time.time() - start
         logger.info(
@@ -193,6 +248,23 @@ class DrugIndex:
             elapsed,
         )
 
+    def _persist(self) -> None:
+        """Write entries, postings and revision to the disk cache."""
+        rows = [_entry_row(e) for e in self._entries]
+        payload = (
+            rows, _get_postings(self), self._revision, self._fetched_at
+        )
+        cache_response(
+            _INDEX_DISK_KEY,
+            pickle.dumps(payload, protocol=5),
+            _INDEX_CACHE_TTL,
+        )
+
+
+def _list_revision(codes: list[str]) -> str:
+    """Digest the SUKL code list to detect upstream changes."""
+    return hashlib.sha256("\n".join(codes).encode()).hexdigest()
+
 
 # Module-level singleton
 _index: DrugIndex | None = None
@@ -226,18 +298,17 @@ async def _fetch_drug_list(
     if cached:
         return json.loads(cached)
 
-    async with httpx.AsyncClient(
-        timeout=BULK_DOWNLOAD_TIMEOUT
-    ) as client:
-        resp = await client.get(
-            f"{SUKL_DLP_V1}/lecive-pripravky",
-            params={
-                "typSeznamu": typ_seznamu,
-                "uvedeneCeny": "false",
-            },
-        )
-        resp.raise_for_status()
-        codes = resp.json()
+    client = await get_sukl_client()
+    resp = await client.get(
+        f"{SUKL_DLP_V1}/lecive-pripravky",
+        params={
+            "typSeznamu": typ_seznamu,
+            "uvedeneCeny": "false",
+        },
+        timeout=BULK_DOWNLOAD_TIMEOUT,
+    )
+    resp.raise_for_status()
+    codes = resp.json()
 
     cache_response(
         cache_key, json.dumps(codes), _INDEX_CACHE_TTL
@@ -291,13 +362,13 @@ def _detail_to_entry(detail: dict) -> DrugIndexEntry:
     return DrugIndexEntry(
         sukl_code=detail.get("kodSUKL", ""),
         name=name,
-        name_normalized=normalize_query(name),
+        name_normalized=normalize_text(name),
         strength=detail.get("sila") or "",
         atc_code=atc,
         atc_normalized=atc.lower(),
         form=detail.get("lekovaFormaKod") or "",
         supplement=supplement,
-        supplement_normalized=normalize_query(supplement),
+        supplement_normalized=normalize_text(supplement),
         holder_code=holder,
     )
 
@@ -323,17 +394,83 @@ def search_index(
     if not normalized_q:
         return [], 0
 
-    matches: list[DrugIndexEntry] = []
-    for entry in index._entries:
-        if (
-            normalized_q in entry.name_normalized
-            or normalized_q == entry.atc_normalized
-            or normalized_q in entry.supplement_normalized
-            or normalized_q in entry.holder_code
-        ):
-            matches.append(entry)
+    entries = index._entries
+    ids = None
+    if len(normalized_q) >= _GRAM:
+        ids = _candidate_ids(
+            _get_postings(index),
+            normalized_q,
+            len(entries) // _DENSE_FRACTION,
+        )
+    candidates = entries if ids is None else [entries[i] for i in ids]
+
+    matches = [e for e in candidates if _matches(e, normalized_q)]
 
     total = len(matches)
     start = compute_skip(page, page_size)
     end = start + page_size
     return matches[start:end], total
+
+
+def _matches(entry: DrugIndexEntry, normalized_q: str) -> bool:
+    """Check a normalized query against one index entry."""
+    return (
+        normalized_q in entry.name_normalized
+        or normalized_q == entry.atc_normalized
+        or normalized_q in entry.supplement_normalized
+        or normalized_q in entry.holder_code
+    )
+
+
+def _get_postings(index: DrugIndex) -> _Postings:
+    """Return the trigram postings for the index's current entries."""
+    cached = index._postings
+    if cached is not None and cached[0] is index._entries:
+        return cached[1]
+
+    postings: _Postings = {}
+    for i, entry in enumerate(index._entries):
+        # Every field a query can match is a substring of this text,
+        # so its trigrams are a superset of any matching query's.
+        text = "\x00".join((
+            entry.name_normalized,
+            entry.atc_normalized,
+            entry.supplement_normalized,
+            entry.holder_code,
+        ))
+        for gram in {
+            text[j : j + _GRAM] for j in range(len(text) - _GRAM + 1)
+        }:
+            ids = postings.get(gram)
+            if ids is None:
+                ids = postings[gram] = array("i")
+            ids.append(i)
+    index._postings = (index._entries, postings)
+    return postings
+
+
+def _candidate_ids(
+    postings: _Postings, normalized_q: str, max_postings: int
+) -> list[int] | None:
+    """Return ascending positions of entries holding every query trigram.
+
+    The result may include false positives and must be verified.
+    Returns None when even the rarest trigram is in more than
+    ``max_postings`` entries, leaving the caller to scan instead.
+    """
+    lists = []
+    for j in range(len(normalized_q) - _GRAM + 1):
+        ids = postings.get(normalized_q[j : j + _GRAM])
+        if ids is None:
+            return []
+        lists.append(ids)
+    lists.sort(key=len)
+    if len(lists[0]) > max_postings:
+        return None
+    found = set(lists[0])
+    for ids in lists[1:]:
+        # Dense trigrams barely narrow the set; the caller verifies.
+        if not found or len(ids) > max_postings:
+            break
+        found.intersection_update(ids)
+    return sorted(found)
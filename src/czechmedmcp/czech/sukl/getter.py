@@ -6,6 +6,7 @@ document metadata. Enhanced PIL/SPC with HTML parsing.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -21,6 +22,9 @@ from czechmedmcp.czech.response import format_czech_response
 from czechmedmcp.czech.sukl.client import (
     SUKL_DLP_V1,
     SUKL_HTTP_TIMEOUT,
+    cache_json,
+    get_cached_json,
+    get_sukl_client,
 )
 from czechmedmcp.czech.sukl.client import (
     fetch_drug_detail as _fetch_drug_detail,
@@ -71,19 +75,18 @@ async def _fetch_composition(sukl_code: str) -> list[dict]:
     url = f"{SUKL_DLP_V1}/slozeni/{sukl_code}"
     cache_key = generate_cache_key("GET", url, {})
 
-    cached = get_cached_response(cache_key)
-    if cached:
-        return json.loads(cached)
+    cached = await get_cached_json(cache_key, _CACHE_TTL)
+    if cached is not None:
+        # Entries cached before coercion may hold a non-list.
+        return cached if isinstance(cached, list) else []
 
     try:
-        async with httpx.AsyncClient(
-            timeout=SUKL_HTTP_TIMEOUT
-        ) as client:
-            resp = await client.get(url)
-            if resp.status_code == 404:
-                return []
-            resp.raise_for_status()
-            data = resp.json()
+        client = await get_sukl_client()
+        resp = await client.get(url, timeout=SUKL_HTTP_TIMEOUT)
+        if resp.status_code == 404:
+            return []
+        resp.raise_for_status()
+        data = resp.json()
     except httpx.HTTPError:
         logger.warning(
             "Failed to fetch composition for %s",
@@ -91,10 +94,9 @@ async def _fetch_composition(sukl_code: str) -> list[dict]:
         )
         return []
 
-    cache_response(
-        cache_key, json.dumps(data), _CACHE_TTL
-    )
-    return data if isinstance(data, list) else []
+    result = data if isinstance(data, list) else []
+    await cache_json(cache_key, result, _CACHE_TTL)
+    return result
 
 
 async def _fetch_doc_metadata(
@@ -107,19 +109,20 @@ async def _fetch_doc_metadata(
     params = {"typ": typ} if typ else {}
     cache_key = generate_cache_key("GET", url, params)
 
-    cached = get_cached_response(cache_key)
-    if cached:
-        return json.loads(cached)
+    cached = await get_cached_json(cache_key, _CACHE_TTL)
+    if cached is not None:
+        # Entries cached before coercion may hold a non-list.
+        return cached if isinstance(cached, list) else []
 
     try:
-        async with httpx.AsyncClient(
-            timeout=SUKL_HTTP_TIMEOUT
-        ) as client:
-            resp = await client.get(url, params=params)
-            if resp.status_code == 404:
-                return []
-            resp.raise_for_status()
-            data = resp.json()
+        client = await get_sukl_client()
+        resp = await client.get(
+            url, params=params, timeout=SUKL_HTTP_TIMEOUT
+        )
+        if resp.status_code == 404:
+            return []
+        resp.raise_for_status()
+        data = resp.json()
     except httpx.HTTPError:
         logger.warning(
             "Failed to fetch doc metadata for %s",
@@ -128,9 +131,7 @@ async def _fetch_doc_metadata(
         return []
 
     result = data if isinstance(data, list) else []
-    cache_response(
-        cache_key, json.dumps(result), _CACHE_TTL
-    )
+    await cache_json(cache_key, result, _CACHE_TTL)
     return result
 
 
@@ -147,11 +148,9 @@ def _build_doc_url(
 async def _url_is_reachable(url: str) -> bool:
     """Check if a URL returns 200 via HEAD request."""
     try:
-        async with httpx.AsyncClient(
-            timeout=SUKL_HTTP_TIMEOUT
-        ) as client:
-            resp = await client.head(url)
-            return resp.status_code == 200
+        client = await get_sukl_client()
+        resp = await client.head(url, timeout=SUKL_HTTP_TIMEOUT)
+        return resp.status_code == 200
     except httpx.HTTPError:
         return False
 
@@ -175,14 +174,12 @@ async def _fetch_substance_name(
         )
 
     try:
-        async with httpx.AsyncClient(
-            timeout=SUKL_HTTP_TIMEOUT
-        ) as client:
-            resp = await client.get(url)
-            if resp.status_code == 404:
-                return None
-            resp.raise_for_status()
-            data = resp.json()
+        client = await get_sukl_client()
+        resp = await client.get(url, timeout=SUKL_HTTP_TIMEOUT)
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+        data = resp.json()
     except httpx.HTTPError:
         logger.warning(
             "Failed to fetch substance name for %s",
@@ -258,16 +255,19 @@ async def _composition_to_substances(
 
 async def _sukl_drug_details(sukl_code: str) -> str:
     """Get full drug details by SUKL code."""
-    detail = await _fetch_drug_detail(sukl_code)
+    # The three lookups are keyed only by the code; fetch them in
+    # one round-trip instead of three.
+    detail, composition, doc_meta = await asyncio.gather(
+        _fetch_drug_detail(sukl_code),
+        _fetch_composition(sukl_code),
+        _fetch_doc_metadata(sukl_code),
+    )
     if not detail:
         return json.dumps(
             {"error": f"Drug not found: {sukl_code}"},
             ensure_ascii=False,
         )
 
-    composition = await _fetch_composition(sukl_code)
-    doc_meta = await _fetch_doc_metadata(sukl_code)
-
     spc_docs = [
         d for d in doc_meta if d.get("typ") == "spc"
     ]
@@ -352,13 +352,11 @@ async def _fetch_doc_html(doc_url: str) -> str | None:
         return cached
 
     try:
-        async with httpx.AsyncClient(
-            timeout=SUKL_HTTP_TIMEOUT
-        ) as client:
-            resp = await client.get(doc_url)
-            if not resp.is_success:
-                return None
-            html = resp.text
+        client = await get_sukl_client()
+        resp = await client.get(doc_url, timeout=SUKL_HTTP_TIMEOUT)
+        if not resp.is_success:
+            return None
+        html = resp.text
     except httpx.HTTPError:
         logger.warning(
             "Failed to fetch document from %s", doc_url
@@ -505,16 +503,16 @@ async def _sukl_document_getter(
     """
     label = "SPC" if doc_type == "spc" else "PIL"
 
-    detail = await _fetch_drug_detail(sukl_code)
+    detail, doc_meta = await asyncio.gather(
+        _fetch_drug_detail(sukl_code),
+        _fetch_doc_metadata(sukl_code, typ=doc_type),
+    )
     if not detail:
         return json.dumps(
             {"error": f"Drug not found: {sukl_code}"},
             ensure_ascii=False,
         )
 
-    doc_meta = await _fetch_doc_metadata(
-        sukl_code, typ=doc_type
-    )
     name = detail.get("nazev", "")
 
     if not doc_meta:
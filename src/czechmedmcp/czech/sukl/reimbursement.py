@@ -17,6 +17,7 @@ from czechmedmcp.czech.response import format_czech_response
 from czechmedmcp.czech.sukl.client import (
     fetch_drug_detail as _fetch_drug_detail,
 )
+from czechmedmcp.czech.sukl.client import get_sukl_client
 from czechmedmcp.czech.sukl.models import Reimbursement
 from czechmedmcp.http_client import (
     cache_response,
@@ -49,21 +50,19 @@ async def _get_reimbursement(sukl_code: str) -> str:
         data = json.loads(cached)
     else:
         try:
-            async with httpx.AsyncClient(
-                timeout=CZECH_HTTP_TIMEOUT,
-            ) as client:
-                resp = await client.get(url)
-                if resp.status_code == 404:
-                    return format_czech_response(
-                        data={
-                            "sukl_code": sukl_code,
-                            "name": name,
-                            "error": "Reimbursement data not found",
-                        },
-                        tool_name="get_reimbursement",
-                    )
-                resp.raise_for_status()
-                data = resp.json()
+            client = await get_sukl_client()
+            resp = await client.get(url, timeout=CZECH_HTTP_TIMEOUT)
+            if resp.status_code == 404:
+                return format_czech_response(
+                    data={
+                        "sukl_code": sukl_code,
+                        "name": name,
+                        "error": "Reimbursement data not found",
+                    },
+                    tool_name="get_reimbursement",
+                )
+            resp.raise_for_status()
+            data = resp.json()
         except httpx.HTTPError as e:
             logger.warning(
                 "Reimbursement fetch failed for %s: %s",
@@ -14,6 +14,7 @@ from czechmedmcp.constants import CACHE_TTL_DAY, compute_skip
 from czechmedmcp.czech.sukl.client import (
     SUKL_DLP_V1,
     SUKL_HTTP_TIMEOUT,
+    get_sukl_client,
 )
 from czechmedmcp.czech.sukl.drug_index import (
     get_drug_index,
@@ -173,29 +174,27 @@ async def _fetch_pharmacies(
         return json.loads(cached)
 
     try:
-        async with httpx.AsyncClient(
-            timeout=SUKL_HTTP_TIMEOUT
-        ) as client:
-            resp = await client.get(
-                _PHARMACY_URL, params=params
+        client = await get_sukl_client()
+        resp = await client.get(
+            _PHARMACY_URL, params=params, timeout=SUKL_HTTP_TIMEOUT
+        )
+        if resp.status_code == 504:
+            logger.warning(
+                "SUKL pharmacy API returned 504 "
+                "— endpoint may be unavailable"
+            )
+            return _pharmacy_unavailable_result(
+                city, postal_code
+            )
+        if not resp.is_success:
+            logger.warning(
+                "SUKL pharmacy API HTTP %d",
+                resp.status_code,
+            )
+            return _pharmacy_unavailable_result(
+                city, postal_code
             )
-            if resp.status_code == 504:
-                logger.warning(
-                    "SUKL pharmacy API returned 504 "
-                    "— endpoint may be unavailable"
-                )
-                return _pharmacy_unavailable_result(
-                    city, postal_code
-                )
-            if not resp.is_success:
-                logger.warning(
-                    "SUKL pharmacy API HTTP %d",
-                    resp.status_code,
-                )
-                return _pharmacy_unavailable_result(
-                    city, postal_code
-                )
-            data = resp.json()
+        data = resp.json()
     except (httpx.HTTPError, httpx.TimeoutException):
         logger.warning(
             "Failed to fetch pharmacies — "
@@ -6,6 +6,7 @@ in-memory search with diskcache for the raw data.
 Data source: https://szv.mzcr.cz/Vykon/Export/
 """
 
+import asyncio
 import io
 import json
 import logging
@@ -13,16 +14,25 @@ import logging
 import httpx
 import openpyxl
 
+from czechmedmcp.connection_pool import get_connection_pool
 from czechmedmcp.constants import (
     BULK_DOWNLOAD_TIMEOUT,
     CACHE_TTL_DAY,
     DEFAULT_CACHE_TIMEOUT,
 )
-from czechmedmcp.czech.diacritics import normalize_query
+from czechmedmcp.czech.diacritics import normalize_query, normalize_text
+from czechmedmcp.czech.search_columns import (
+    SearchColumns,
+    build_search_columns,
+    intern_columns,
+    matching_rows,
+)
 from czechmedmcp.http_client import (
     cache_response,
     generate_cache_key,
     get_cached_response,
+    pickle_payload,
+    unpickle_payload,
 )
 from czechmedmcp.utils.retry import async_retry
 
@@ -32,32 +42,54 @@ _SZV_EXPORT_URL = "https://szv.mzcr.cz/Vykon/Export/"
 _LIST_CACHE_TTL = CACHE_TTL_DAY
 _DETAIL_CACHE_TTL = DEFAULT_CACHE_TIMEOUT
 
+# Export columns with few distinct values; see intern_columns.
+_INTERNED_COLUMNS = (
+    "Kategorie",
+    "Odbornost",
+    "Další odbornosti",
+    "Nositel",
+    "OF",
+    "OM",
+)
+
 # Module-level cache
 _PROCEDURES: list[dict] | None = None
+_LOAD_LOCK = asyncio.Lock()
+_COLUMNS: SearchColumns | None = None
 
 
-async def _download_excel() -> list[dict]:  # noqa: C901
+async def _download_excel() -> list[dict]:
     """Download SZV Excel export and parse procedures.
 
+    The parsed rows are pickled to diskcache together with their
+    search columns, so a new process skips both the Excel parse and
+    the column build.
+
     Raises:
         RuntimeError: When download or parse fails,
             with a descriptive message for the caller.
     """
+    global _COLUMNS
     cache_key = generate_cache_key(
-        "PARSED", "szv:procedures", {}
+        "PARSED", "szv:procedures:v5", {}
     )
-    cached = get_cached_response(cache_key)
-    if cached:
-        return json.loads(cached)
+    cached = unpickle_payload(get_cached_response(cache_key))
+    if isinstance(cached, SearchColumns):
+        _COLUMNS = cached
+        return cached.rows
 
+    # Missing or unreadable: re-parse and overwrite the entry.
     async def _do_download() -> bytes:
-        async with httpx.AsyncClient(
+        client = await get_connection_pool(
+            True, httpx.Timeout(BULK_DOWNLOAD_TIMEOUT)
+        )
+        resp = await client.get(
+            _SZV_EXPORT_URL,
             timeout=BULK_DOWNLOAD_TIMEOUT,
             follow_redirects=True,
-        ) as client:
-            resp = await client.get(_SZV_EXPORT_URL)
-            resp.raise_for_status()
-            return resp.content
+        )
+        resp.raise_for_status()
+        return resp.content
 
     try:
         content = await async_retry(
@@ -96,12 +128,8 @@ async def _download_excel() -> list[dict]:  # noqa: C901
         ) from None
 
     try:
-        wb = openpyxl.load_workbook(
-            io.BytesIO(content), read_only=True
-        )
-        ws = wb["Export"]
-        rows = list(ws.iter_rows(values_only=True))
-        wb.close()
+        # Parsing takes seconds; keep it off the event loop.
+        procedures = await asyncio.to_thread(_parse_excel, content)
     except Exception as exc:
         logger.error(
             "SZV Excel parse error: %s", exc
@@ -110,41 +138,90 @@ async def _download_excel() -> list[dict]:  # noqa: C901
             f"SZV Excel parse failed: {exc}"
         ) from None
 
-    if not rows:
+    if not procedures:
         return []
 
-    headers = [str(h or "").strip() for h in rows[0]]
-    procedures = []
-    for row in rows[1:]:
-        entry = dict(zip(headers, row, strict=False))
-        if entry.get("Kód"):
-            procedures.append(entry)
-
     cache_response(
         cache_key,
-        json.dumps(
-            procedures,
-            ensure_ascii=False,
-            default=str,
-        ),
+        pickle_payload(_get_search_columns(procedures)),
         _LIST_CACHE_TTL,
     )
     return procedures
 
 
+def _parse_excel(content: bytes) -> list[dict]:
+    """Parse the Export sheet into one dict per coded procedure row.
+
+    Rows are streamed from the read-only workbook, and rows without a
+    code are skipped before a dict is built for them.
+    """
+    wb = openpyxl.load_workbook(io.BytesIO(content), read_only=True)
+    try:
+        rows = wb["Export"].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return []
+        headers = [str(h or "").strip() for h in header]
+        # Last occurrence, as dict(zip(...)) would keep it.
+        code_ix = {h: i for i, h in enumerate(headers)}.get("Kód")
+        if code_ix is None:
+            return []
+        procedures = []
+        for row in rows:
+            if code_ix >= len(row) or not row[code_ix]:
+                continue
+            entry = dict(zip(headers, row, strict=False))
+            intern_columns(entry, _INTERNED_COLUMNS)
+            procedures.append(entry)
+        return procedures
+    finally:
+        wb.close()
+
+
 async def _get_procedures() -> list[dict]:
-    """Return cached or freshly loaded procedure list."""
+    """Return cached or freshly loaded procedure list.
+
+    Concurrent first calls share one download instead of each
+    fetching and parsing the source.
+    """
     global _PROCEDURES
     if _PROCEDURES is not None:
         return _PROCEDURES
 
-    _PROCEDURES = await _download_excel()
-    logger.debug(
-        "Loaded %d SZV procedures", len(_PROCEDURES)
-    )
+    async with _LOAD_LOCK:
+        # Double-check after acquiring lock
+        if _PROCEDURES is None:
+            _PROCEDURES = await _download_excel()
+            logger.debug(
+                "Loaded %d SZV procedures", len(_PROCEDURES)
+            )
     return _PROCEDURES
 
 
+def _get_search_columns(procedures: list[dict]) -> SearchColumns:
+    """Return normalized search columns for ``procedures``.
+
+    Built once per procedure list; rebuilt only if the list is replaced.
+    """
+    global _COLUMNS
+    if _COLUMNS is None or _COLUMNS.rows is not procedures:
+        _COLUMNS = build_search_columns(
+            procedures,
+            code=_procedure_code,
+            fields=(
+                lambda r: _procedure_code(r).lower(),
+                lambda r: normalize_text(str(r.get("Název", ""))),
+                lambda r: normalize_text(str(r.get("Odbornost", ""))),
+            ),
+        )
+    return _COLUMNS
+
+
+def _procedure_code(raw: dict) -> str:
+    """Return the procedure code of an Excel row as a string."""
+    return str(raw.get("Kód", ""))
+
+
 def _raw_to_summary(raw: dict) -> dict:
     """Convert an Excel row to a procedure summary."""
     return {
@@ -183,20 +260,6 @@ def _raw_to_full(raw: dict) -> dict:
     }
 
 
-def _matches_query(raw: dict, normalized_q: str) -> bool:
-    """Return True if the procedure matches the query."""
-    code = str(raw.get("Kód", "")).lower()
-    name = normalize_query(str(raw.get("Název", "")))
-    spec = normalize_query(
-        str(raw.get("Odbornost", ""))
-    )
-    return (
-        normalized_q in code
-        or normalized_q in name
-        or normalized_q in spec
-    )
-
-
 async def _szv_search(
     query: str,
     max_results: int = 10,
@@ -226,13 +289,11 @@ async def _szv_search(
         )
 
     normalized_q = normalize_query(query)
-    matches: list[dict] = []
-
-    for raw in procedures:
-        if _matches_query(raw, normalized_q):
-            matches.append(_raw_to_summary(raw))
-            if len(matches) >= max_results:
-                break
+    columns = _get_search_columns(procedures)
+    matches = [
+        _raw_to_summary(procedures[i])
+        for i in matching_rows(columns, normalized_q, max_results)
+    ]
 
     return json.dumps(
         {"total": len(matches), "results": matches},
@@ -260,15 +321,10 @@ async def _szv_get(code: str) -> str:
             ensure_ascii=False,
         )
 
-    code_lower = code.strip().lower()
-    for raw in procedures:
-        raw_code = str(
-            raw.get("Kód", "")
-        ).strip().lower()
-        if raw_code == code_lower:
-            return json.dumps(
-                _raw_to_full(raw), ensure_ascii=False
-            )
+    columns = _get_search_columns(procedures)
+    raw = columns.by_code.get(code.strip().lower())
+    if raw is not None:
+        return json.dumps(_raw_to_full(raw), ensure_ascii=False)
 
     return json.dumps(
         {"error": f"Procedure not found: {code}"},
@@ -13,6 +13,7 @@ from pathlib import Path
 
 import httpx
 
+from czechmedmcp.connection_pool import get_connection_pool
 from czechmedmcp.constants import (
     CACHE_TTL_DAY,
     CZECH_HTTP_TIMEOUT,
@@ -70,20 +71,22 @@ async def load_vzp_reimbursement_data() -> dict[str, dict]:
 async def _download_csv() -> str | None:
     """Download VZP reimbursement CSV."""
     try:
-        async with httpx.AsyncClient(
-            timeout=CZECH_HTTP_TIMEOUT,
-        ) as client:
-            resp = await client.get(_VZP_CSV_URL)
-            if resp.is_success and resp.text.strip():
-                logger.info(
-                    "Downloaded VZP CSV (%d bytes)",
-                    len(resp.text),
-                )
-                return resp.text
-            logger.warning(
-                "VZP CSV download failed: HTTP %d",
-                resp.status_code,
+        client = await get_connection_pool(
+            True, httpx.Timeout(CZECH_HTTP_TIMEOUT)
+        )
+        resp = await client.get(
+            _VZP_CSV_URL, timeout=CZECH_HTTP_TIMEOUT
+        )
+        if resp.is_success and resp.text.strip():
+            logger.info(
+                "Downloaded VZP CSV (%d bytes)",
+                len(resp.text),
             )
+            return resp.text
+        logger.warning(
+            "VZP CSV download failed: HTTP %d",
+            resp.status_code,
+        )
     except httpx.HTTPError as exc:
         logger.warning("VZP CSV download error: %s", exc)
     return None
@@ -6,6 +6,7 @@ media.vzpstatic.cz and provides in-memory search.
 Data source: https://www.vzp.cz/poskytovatele/ciselniky
 """
 
+import asyncio
 import csv
 import io
 import json
@@ -14,16 +15,25 @@ import zipfile
 
 import httpx
 
+from czechmedmcp.connection_pool import get_connection_pool
 from czechmedmcp.constants import (
     CACHE_TTL_DAY,
     CZECH_HTTP_TIMEOUT,
     DEFAULT_CACHE_TIMEOUT,
 )
-from czechmedmcp.czech.diacritics import normalize_query
+from czechmedmcp.czech.diacritics import normalize_query, normalize_text
+from czechmedmcp.czech.search_columns import (
+    SearchColumns,
+    build_search_columns,
+    intern_columns,
+    matching_rows,
+)
 from czechmedmcp.http_client import (
     cache_response,
     generate_cache_key,
     get_cached_response,
+    pickle_payload,
+    unpickle_payload,
 )
 
 logger = logging.getLogger(__name__)
@@ -44,61 +54,117 @@ _VZP_FIELDS = [
     "BOD", "KAT", "UMA", "UBO",
 ]
 
+# Codebook fields with few distinct values; see intern_columns.
+_INTERNED_COLUMNS = ("ODB", "OME", "OMO", "KAT", "ZUM")
+
 # Module-level cache
 _ENTRIES: list[dict] | None = None
+_LOAD_LOCK = asyncio.Lock()
+_COLUMNS: SearchColumns | None = None
 
 
 async def _download_codebook() -> list[dict]:
-    """Download and parse VZP codebook ZIP."""
+    """Download and parse VZP codebook ZIP.
+
+    The parsed entries are pickled to diskcache together with their
+    search columns, so a new process skips both the CSV parse and the
+    column build.
+    """
+    global _COLUMNS
     cache_key = generate_cache_key(
-        "PARSED", f"vzp:vykony:{_VZP_VERSION}", {}
+        "PARSED", f"vzp:vykony:{_VZP_VERSION}:v5", {}
     )
-    cached = get_cached_response(cache_key)
-    if cached:
-        return json.loads(cached)
-
-    async with httpx.AsyncClient(
+    cached = unpickle_payload(get_cached_response(cache_key))
+    if isinstance(cached, SearchColumns):
+        _COLUMNS = cached
+        return cached.rows
+    # Missing or unreadable: re-parse and overwrite the entry.
+
+    client = await get_connection_pool(
+        True, httpx.Timeout(CZECH_HTTP_TIMEOUT)
+    )
+    resp = await client.get(
+        _VZP_ZIP_URL,
         timeout=CZECH_HTTP_TIMEOUT,
         follow_redirects=True,
-    ) as client:
-        resp = await client.get(_VZP_ZIP_URL)
-        resp.raise_for_status()
-        content = resp.content
+    )
+    resp.raise_for_status()
+    content = resp.content
 
-    with zipfile.ZipFile(io.BytesIO(content)) as zf:
-        filename = zf.namelist()[0]
-        raw = zf.read(filename).decode("cp852")
-
-    reader = csv.reader(io.StringIO(raw))
-    entries = []
-    for row in reader:
-        if len(row) >= len(_VZP_FIELDS):
-            entry = dict(zip(_VZP_FIELDS, row, strict=False))
-            # Skip empty/header rows
-            if entry["KOD"] and entry["KOD"] != "KOD":
-                entries.append(entry)
+    # Keep the unzip and CSV parse off the event loop.
+    entries = await asyncio.to_thread(_parse_codebook, content)
 
     cache_response(
         cache_key,
-        json.dumps(entries, ensure_ascii=False),
+        pickle_payload(_get_search_columns(entries)),
         _CODEBOOK_CACHE_TTL,
     )
     return entries
 
 
+def _parse_codebook(content: bytes) -> list[dict]:
+    """Parse the codebook CSV inside the VZP ZIP into entry dicts.
+
+    The CP852 member is decoded while ``csv`` reads it, so the whole
+    text is never held in memory as one string.
+    """
+    n_fields = len(_VZP_FIELDS)
+    with zipfile.ZipFile(io.BytesIO(content)) as zf:
+        filename = zf.namelist()[0]
+        with zf.open(filename) as fh:
+            reader = csv.reader(
+                io.TextIOWrapper(fh, encoding="cp852", newline="")
+            )
+            entries = []
+            for row in reader:
+                # Skip short, empty and header rows
+                if len(row) < n_fields or not row[0] or row[0] == "KOD":
+                    continue
+                entry = dict(zip(_VZP_FIELDS, row, strict=False))
+                intern_columns(entry, _INTERNED_COLUMNS)
+                entries.append(entry)
+            return entries
+
+
 async def _get_entries() -> list[dict]:
-    """Return cached or freshly loaded codebook entries."""
+    """Return cached or freshly loaded codebook entries.
+
+    Concurrent first calls share one download instead of each
+    fetching and parsing the source.
+    """
     global _ENTRIES
     if _ENTRIES is not None:
         return _ENTRIES
 
-    _ENTRIES = await _download_codebook()
-    logger.debug(
-        "Loaded %d VZP codebook entries", len(_ENTRIES)
-    )
+    async with _LOAD_LOCK:
+        # Double-check after acquiring lock
+        if _ENTRIES is None:
+            _ENTRIES = await _download_codebook()
+            logger.debug(
+                "Loaded %d VZP codebook entries", len(_ENTRIES)
+            )
     return _ENTRIES
 
 
+def _get_search_columns(entries: list[dict]) -> SearchColumns:
+    """Return normalized search columns for ``entries``.
+
+    Built once per entry list; rebuilt only if the list is replaced.
+    """
+    global _COLUMNS
+    if _COLUMNS is None or _COLUMNS.rows is not entries:
+        _COLUMNS = build_search_columns(
+            entries,
+            code=lambda r: r.get("KOD", ""),
+            fields=(
+                lambda r: r.get("KOD", "").lower(),
+                lambda r: normalize_text(r.get("NAZ", "")),
+                lambda r: normalize_text(r.get("VYS", "")),
+            ),
+        )
+    return _COLUMNS
+
+
 def _entry_to_summary(
     raw: dict, codebook_type: str,
 ) -> dict:
@@ -138,20 +204,6 @@ def _normalise_entry(
     }
 
 
-def _matches_query(
-    raw: dict, normalized_q: str,
-) -> bool:
-    """Return True if the entry matches the query."""
-    code = raw.get("KOD", "").lower()
-    name = normalize_query(raw.get("NAZ", ""))
-    desc = normalize_query(raw.get("VYS", ""))
-    return (
-        normalized_q in code
-        or normalized_q in name
-        or normalized_q in desc
-    )
-
-
 async def _vzp_search(
     query: str,
     codebook_type: str | None = None,
@@ -183,15 +235,11 @@ async def _vzp_search(
         )
 
     normalized_q = normalize_query(query)
-    matches: list[dict] = []
-
-    for raw in entries:
-        if _matches_query(raw, normalized_q):
-            matches.append(
-                _entry_to_summary(raw, ctype)
-            )
-            if len(matches) >= max_results:
-                break
+    columns = _get_search_columns(entries)
+    matches = [
+        _entry_to_summary(entries[i], ctype)
+        for i in matching_rows(columns, normalized_q, max_results)
+    ]
 
     return json.dumps(
         {"total": len(matches), "results": matches},
@@ -220,13 +268,13 @@ async def _vzp_get(
             ensure_ascii=False,
         )
 
-    code_lower = code.strip().lower()
-    for raw in entries:
-        if raw.get("KOD", "").strip().lower() == code_lower:
-            return json.dumps(
-                _normalise_entry(raw, codebook_type),
-                ensure_ascii=False,
-            )
+    columns = _get_search_columns(entries)
+    raw = columns.by_code.get(code.strip().lower())
+    if raw is not None:
+        return json.dumps(
+            _normalise_entry(raw, codebook_type),
+            ensure_ascii=False,
+        )
 
     return json.dumps(
         {
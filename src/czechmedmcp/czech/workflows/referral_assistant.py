@@ -3,6 +3,7 @@
 Maps diagnosis → specialty → find providers.
 """
 
+import asyncio
 import json
 import logging
 
@@ -52,10 +53,12 @@ async def _referral_assistant(
     Returns:
         Dual output JSON string.
     """
-    diag = await _get_diagnosis_info(diagnosis_code)
     specialty = _map_specialty(diagnosis_code)
-    providers = await _search_providers(
-        city, specialty, max_providers
+    # The specialty comes from the code itself, so the MKN-10 lookup
+    # and the NRPZS search (and their cold downloads) run concurrently.
+    diag, providers = await asyncio.gather(
+        _get_diagnosis_info(diagnosis_code),
+        _search_providers(city, specialty, max_providers),
     )
 
     data = {
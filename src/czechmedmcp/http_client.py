@@ -1,11 +1,15 @@
 import csv
 import hashlib
 import json
+import logging
 import os
+import pickle
 import ssl
+import zlib
+from dataclasses import fields, is_dataclass
 from io import StringIO
 from ssl import PROTOCOL_TLS_CLIENT, SSLContext, TLSVersion
-from typing import Literal, TypeVar
+from typing import Any, Literal, TypeVar
 from urllib.parse import urlparse
 
 import certifi
@@ -34,6 +38,8 @@ from .retry import (
 )
 from .utils.endpoint_registry import get_registry
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T", bound=BaseModel)
 
 _DEFAULT_BREAKER_CONFIG = CircuitBreakerConfig(
@@ -74,7 +80,7 @@ def generate_cache_key(method: str, url: str, params: dict) -> str:
     return hash_value
 
 
-def cache_response(cache_key: str, content: str, ttl: int):
+def cache_response(cache_key: str, content: str | bytes, ttl: int):
     expire = None if ttl == -1 else ttl
     cache = get_cache()
     cache.set(cache_key, content, expire=expire)
@@ -85,6 +91,37 @@ def get_cached_response(cache_key: str) -> str | None:
     return cache.get(cache_key)
 
 
+def pickle_payload(value: Any, compress: bool = False) -> bytes:
+    """Serialize a parsed object for storage with cache_response."""
+    payload = pickle.dumps(value, protocol=5)
+    return zlib.compress(payload) if compress else payload
+
+
+def unpickle_payload(cached: Any, compress: bool = False) -> Any | None:
+    """Load an object stored with pickle_payload.
+
+    Returns None for a cache miss, a non-bytes entry, or a payload
+    that can't be decoded (truncated, or pickled from classes that
+    have since changed), so callers can rebuild and overwrite it.
+    Dataclass payloads missing a field are treated the same way.
+    """
+    if not isinstance(cached, bytes):
+        return None
+    try:
+        if compress:
+            cached = zlib.decompress(cached)
+        value = pickle.loads(cached)  # noqa: S301
+    except Exception:
+        logger.warning("Discarding unreadable cached payload", exc_info=True)
+        return None
+    if is_dataclass(value) and not all(
+        hasattr(value, f.name) for f in fields(value)
+    ):
+        logger.warning("Discarding incomplete cached %s", type(value))
+        return None
+    return value
+
+
 def get_ssl_context(tls_version: TLSVersion) -> SSLContext:
     """Create an SSLContext with the specified TLS version."""
     context = SSLContext(PROTOCOL_TLS_CLIENT)
@@ -2,6 +2,7 @@
 
 import re
 from collections.abc import Sequence
+from functools import lru_cache
 from typing import Protocol
 
 
@@ -11,6 +12,17 @@ class MutationHitProtocol(Protocol):
     protein_change: str
 
 
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern[str] | None:
+    """Compile a mutation pattern, treating ``*`` as a wildcard."""
+    # Escape special regex characters except *
+    escaped_pattern = re.escape(pattern).replace(r"\*", ".*")
+    try:
+        return re.compile(f"^{escaped_pattern}$")
+    except re.error:
+        return None
+
+
 class MutationFilter:
     """Filter mutations based on specific mutation or pattern."""
 
@@ -64,14 +76,12 @@ class MutationFilter:
             prefix = self.pattern[:-1]
             return protein_change.startswith(prefix)
 
-        # Try regex match
-        try:
-            # Escape special regex characters except *
-            escaped_pattern = re.escape(self.pattern).replace(r"\*", ".*")
-            return bool(re.match(f"^{escaped_pattern}$", protein_change))
-        except re.error:
+        # Try regex match, compiled once per pattern
+        regex = _compile_pattern(self.pattern)
+        if regex is None:
             # Fallback to simple prefix match
             return protein_change.startswith(self.pattern)
+        return regex.match(protein_change) is not None
 
     def filter_mutations(
         self, mutations: Sequence[MutationHitProtocol]
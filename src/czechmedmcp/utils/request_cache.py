@@ -1,9 +1,10 @@
 """Simple request-level caching for API calls."""
 
 import asyncio
+import inspect
 import time
 from collections import OrderedDict
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Hashable
 from functools import wraps
 from typing import Any, TypeVar
 
@@ -13,26 +14,35 @@ class LRUCache:
     """Simple LRU cache with TTL support."""
 
     def __init__(self, max_size: int = 1000):
-        self.cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self.cache: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
         self.max_size = max_size
         self._lock = asyncio.Lock()
 
-    async def get(self, key: str) -> Any | None:
+    async def get(self, key: Hashable) -> Any | None:
         """Get item from cache if not expired."""
         async with self._lock:
-            if key not in self.cache:
-                return None
+            return self.get_nowait(key)
 
-            value, expiry = self.cache[key]
-            if time.time() > expiry:
-                del self.cache[key]
-                return None
+    def get_nowait(self, key: Hashable) -> Any | None:
+        """Get item from cache without awaiting the lock.
 
-            # Move to end (most recently used)
-            self.cache.move_to_end(key)
-            return value
+        The lookup never yields to the event loop, so it is safe to call
+        from a coroutine and avoids the lock round-trip on hot paths.
+        """
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
 
-    async def set(self, key: str, value: Any, ttl: float):
+        value, expiry = entry
+        if time.time() > expiry:
+            del self.cache[key]
+            return None
+
+        # Move to end (most recently used)
+        self.cache.move_to_end(key)
+        return value
+
+    async def set(self, key: Hashable, value: Any, ttl: float):
         """Set item in cache with TTL."""
         async with self._lock:
             # Remove oldest items if at capacity
@@ -85,6 +95,11 @@ async def set_cached(key: str, value: Any, ttl: int = DEFAULT_TTL) -> None:
 def request_cache(ttl: int = DEFAULT_TTL) -> Callable:
     """Decorator for caching async function results.
 
+    Keys are built from the function's qualified name and its
+    arguments. For methods the bound ``self`` is left out, so all
+    instances of a class share entries; decorated methods must not
+    depend on per-instance state.
+
     Args:
         ttl: Time to live in seconds
 
@@ -95,6 +110,10 @@ def request_cache(ttl: int = DEFAULT_TTL) -> Callable:
     def decorator(
         func: Callable[..., Awaitable[T]],
     ) -> Callable[..., Awaitable[T]]:
+        name = f"{func.__module__}.{func.__qualname__}"
+        params = list(inspect.signature(func).parameters)
+        skip = 1 if params[:1] == ["self"] else 0
+
         @wraps(func)
         async def wrapper(*args, **kwargs) -> T:
             # Skip caching if explicitly disabled
@@ -102,7 +121,7 @@ def request_cache(ttl: int = DEFAULT_TTL) -> Callable:
                 return await func(*args, **kwargs)
 
             # Generate cache key
-            key = f"{func.__module__}.{func.__name__}:{cache_key(*args, **kwargs)}"
+            key = f"{name}:{cache_key(*args[skip:], **kwargs)}"
 
             # Check cache
             cached_value = await get_cached(key)
@@ -4,13 +4,27 @@ Consolidates duplicated gene ID lookup, molecular profile fetching,
 and batch mutation fetching used across multiple cBioPortal clients.
 """
 
+import asyncio
 import logging
+from itertools import chain
 from typing import Any
 
 from ..utils.cbio_http_adapter import CBioHTTPAdapter
+from ..utils.request_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Profiles per /mutations/fetch request, and how many such requests
+# may be in flight at once for one batch.
+MUTATION_FETCH_CHUNK_SIZE = 50
+MUTATION_FETCH_CONCURRENCY = 8
+
+# Molecular profile lists by query parameters. The list changes rarely
+# and is needed by every mutation search, so it is kept in process and
+# shared between clients; callers must treat it as read-only.
+_PROFILES_CACHE = LRUCache(max_size=16)
+_PROFILES_LOCK = asyncio.Lock()
+
 
 class CBioPortalCoreClient:
     """Base class with shared cBioPortal API operations."""
@@ -53,6 +67,9 @@ class CBioPortalCoreClient:
     ) -> list[dict[str, Any]]:
         """Fetch molecular profiles filtered by mutation type.
 
+        Successful results are kept in process for ``cache_ttl``
+        seconds and shared by all clients.
+
         Args:
             params: Additional query parameters
             cache_ttl: Cache time-to-live in seconds
@@ -63,21 +80,34 @@ class CBioPortalCoreClient:
         request_params = params or {
             "molecularAlterationType": "MUTATION_EXTENDED"
         }
-        profiles, error = await self.http_adapter.get(
-            "/molecular-profiles",
-            params=request_params,
-            endpoint_key="cbioportal_molecular_profiles",
-            cache_ttl=cache_ttl,
-        )
+        key = tuple(sorted(request_params.items()))
+        cached = _PROFILES_CACHE.get_nowait(key)
+        if cached is not None:
+            return cached
+
+        # Concurrent searches wait for one fetch instead of each
+        # issuing their own.
+        async with _PROFILES_LOCK:
+            cached = _PROFILES_CACHE.get_nowait(key)
+            if cached is not None:
+                return cached
+
+            profiles, error = await self.http_adapter.get(
+                "/molecular-profiles",
+                params=request_params,
+                endpoint_key="cbioportal_molecular_profiles",
+                cache_ttl=cache_ttl,
+            )
 
-        if error or not profiles:
-            logger.warning("Failed to fetch molecular profiles")
-            return []
+            if error or not profiles:
+                logger.warning("Failed to fetch molecular profiles")
+                return []
 
-        if not isinstance(profiles, list):
-            return []
+            if not isinstance(profiles, list):
+                return []
 
-        return profiles
+            await _PROFILES_CACHE.set(key, profiles, cache_ttl)
+            return profiles
 
     async def fetch_mutations_batch(
         self,
@@ -87,6 +117,10 @@ class CBioPortalCoreClient:
     ) -> list[dict[str, Any]]:
         """Batch fetch mutations for a gene across profiles.
 
+        Large profile lists are split into chunks that are fetched
+        concurrently and cached independently; a failed chunk only
+        drops its own profiles.
+
         Args:
             gene_id: Entrez gene ID
             profile_ids: List of molecular profile IDs
@@ -95,6 +129,33 @@ class CBioPortalCoreClient:
         Returns:
             List of raw mutation records from cBioPortal
         """
+        if len(profile_ids) <= MUTATION_FETCH_CHUNK_SIZE:
+            return await self._fetch_mutations_chunk(
+                gene_id, profile_ids, cache_ttl
+            )
+
+        sem = asyncio.Semaphore(MUTATION_FETCH_CONCURRENCY)
+
+        async def _fetch(chunk: list[str]) -> list[dict[str, Any]]:
+            async with sem:
+                return await self._fetch_mutations_chunk(
+                    gene_id, chunk, cache_ttl
+                )
+
+        chunks = [
+            profile_ids[i : i + MUTATION_FETCH_CHUNK_SIZE]
+            for i in range(0, len(profile_ids), MUTATION_FETCH_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(*(_fetch(c) for c in chunks))
+        return list(chain.from_iterable(results))
+
+    async def _fetch_mutations_chunk(
+        self,
+        gene_id: int,
+        profile_ids: list[str],
+        cache_ttl: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch mutations for a gene in one /mutations/fetch request."""
         mutations_data, error = await self.http_adapter.post(
             "/mutations/fetch",
             data={
@@ -1,11 +1,14 @@
 """cBioPortal mutation-specific search functionality."""
 
 import asyncio
+import heapq
 import logging
-from collections import Counter, defaultdict
-from typing import Any, cast
+from collections import Counter
+from itertools import islice
+from operator import attrgetter
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from ..utils.cancer_types_api import get_cancer_type_client
 from ..utils.gene_validator import is_valid_gene_symbol, sanitize_gene_symbol
@@ -16,19 +19,18 @@ from .cbio_core import CBioPortalCoreClient
 
 logger = logging.getLogger(__name__)
 
+# Per-study cancer type requests that may be in flight at once.
+STUDY_CANCER_TYPE_CONCURRENCY = 10
 
-class MutationHit(BaseModel):
-    """A specific mutation occurrence in a study."""
-
-    study_id: str
-    molecular_profile_id: str
-    protein_change: str
-    mutation_type: str
-    start_position: int | None = None
-    end_position: int | None = None
-    reference_allele: str | None = None
-    variant_allele: str | None = None
-    sample_id: str | None = None
+# Mutation record fields that must be strings (a missing field counts
+# as empty), fields that may also be None, and integer fields that may
+# be None. Records breaking any rule are dropped, as when each record
+# was validated into a model.
+_REQUIRED_STR_FIELDS = ("molecularProfileId", "proteinChange", "mutationType")
+_OPTIONAL_STR_FIELDS = ("sampleId", "referenceAllele", "variantAllele")
+_OPTIONAL_INT_FIELDS = ("startPosition", "endPosition")
+# Applies pydantic's int coercion, e.g. "12" and 12.0 pass, 12.5 fails.
+_OPTIONAL_INT = TypeAdapter(int | None)
 
 
 class StudyMutationSummary(BaseModel):
@@ -70,8 +72,6 @@ class CBioPortalMutationClient(CBioPortalCoreClient):
         """Async context manager exit."""
         pass  # No cleanup needed with centralized client
 
-    @request_cache(ttl=1800)  # Cache for 30 minutes
-    @track_api_call("cbioportal_mutation_search")
     async def search_specific_mutation(
         self,
         gene: str,
@@ -81,6 +81,10 @@ class CBioPortalMutationClient(CBioPortalCoreClient):
     ) -> MutationSearchResult | None:
         """Search for specific mutations across all cBioPortal studies.
 
+        Arguments are normalized before validation and the cached
+        search, so calls that differ only in gene casing or
+        surrounding whitespace share one cache entry.
+
         Args:
             gene: Gene symbol (e.g., "SRSF2")
             mutation: Specific mutation (e.g., "F57Y")
@@ -91,12 +95,28 @@ class CBioPortalMutationClient(CBioPortalCoreClient):
             Detailed mutation search results or None if not found
         """
         # Validate gene
+        gene = sanitize_gene_symbol(gene)
         if not is_valid_gene_symbol(gene):
             logger.warning(f"Invalid gene symbol: {gene}")
             return None
 
-        gene = sanitize_gene_symbol(gene)
+        return await self._search_specific_mutation(
+            gene,
+            mutation.strip() if mutation else None,
+            pattern.strip() if pattern else None,
+            max_studies,
+        )
 
+    @request_cache(ttl=1800)  # Cache for 30 minutes
+    @track_api_call("cbioportal_mutation_search")
+    async def _search_specific_mutation(
+        self,
+        gene: str,
+        mutation: str | None,
+        pattern: str | None,
+        max_studies: int,
+    ) -> MutationSearchResult | None:
+        """Run a mutation search with already normalized arguments."""
         try:
             return await self._search_mutations_with_adapter(
                 gene, mutation, pattern, max_studies
@@ -116,49 +136,54 @@ class CBioPortalMutationClient(CBioPortalCoreClient):
         max_studies: int,
     ) -> MutationSearchResult | None:
         """Perform the actual mutation search with the adapter."""
-        entrez_id = await self.get_gene_id(gene)
+        logger.info(f"Fetching gene ID and mutation profiles for {gene}")
+        entrez_id, all_profiles = await asyncio.gather(
+            self.get_gene_id(gene), self.get_mutation_profiles()
+        )
         if not entrez_id:
             return None
-
-        logger.info(f"Fetching mutation profiles for {gene}")
-        all_profiles = await self.get_mutation_profiles()
         if not all_profiles:
             return None
         profile_ids = [
             p["molecularProfileId"] for p in all_profiles
         ]
 
-        # Batch fetch mutations (this is the slow part)
-        logger.info(
-            f"Fetching mutations for {gene} across {len(profile_ids)} profiles"
-        )
-        mutations = await self._fetch_all_mutations(profile_ids, entrez_id)
-
-        if not mutations:
-            logger.info(f"No mutations found for {gene}")
-            return MutationSearchResult(gene=gene)
+        # Study info doesn't depend on the mutations, so resolve it
+        # while the batch fetch runs; cancelled if it goes unused.
+        studies_task = asyncio.ensure_future(self._get_studies_info())
+        try:
+            # Batch fetch mutations (this is the slow part)
+            logger.info(
+                f"Fetching mutations for {gene} across "
+                f"{len(profile_ids)} profiles"
+            )
+            mutations = await self._fetch_all_mutations(
+                profile_ids, entrez_id
+            )
 
-        # Filter mutations based on criteria
-        mutation_filter = MutationFilter(mutation, pattern)
-        filtered_mutations = mutation_filter.filter_mutations(mutations)
+            if not mutations:
+                logger.info(f"No mutations found for {gene}")
+                return MutationSearchResult(gene=gene)
 
-        # Get study information
-        studies_info = await self._get_studies_info()
+            # Get study information
+            studies_info = await studies_task
+        finally:
+            studies_task.cancel()
 
-        # Aggregate results by study
-        study_mutations = self._aggregate_by_study(
-            cast(list[MutationHit], filtered_mutations), studies_info
+        # Filter, aggregate by study and count mutation types in one pass
+        mutation_filter = (
+            MutationFilter(mutation, pattern) if mutation or pattern else None
+        )
+        study_mutations, mutation_types = self._aggregate_by_study(
+            mutations, studies_info, mutation_filter
         )
 
         # Sort by mutation count and take top studies
-        top_studies = sorted(
+        top_studies = heapq.nlargest(
+            max_studies,
             study_mutations.values(),
-            key=lambda x: x.mutation_count,
-            reverse=True,
-        )[:max_studies]
-
-        # Count mutation types
-        mutation_types = Counter(m.protein_change for m in filtered_mutations)
+            key=attrgetter("mutation_count"),
+        )
 
         return MutationSearchResult(
             gene=gene,
@@ -166,7 +191,7 @@ class CBioPortalMutationClient(CBioPortalCoreClient):
             pattern=pattern,
             total_studies=len(all_profiles),
             studies_with_mutation=len(study_mutations),
-            total_mutations=len(filtered_mutations),
+            total_mutations=mutation_types.total(),
             top_studies=top_studies,
             mutation_types=dict(mutation_types.most_common(10)),
         )
@@ -176,49 +201,18 @@ class CBioPortalMutationClient(CBioPortalCoreClient):
         self,
         profile_ids: list[str],
         entrez_id: int,
-    ) -> list[MutationHit]:
-        """Fetch all mutations for a gene across all profiles."""
+    ) -> list[dict[str, Any]]:
+        """Fetch all mutations for a gene across all profiles.
+
+        Records are returned as raw API dicts; those failing
+        ``_is_valid_record`` are dropped.
+        """
         try:
             raw_mutations = await self.fetch_mutations_batch(
                 entrez_id, profile_ids
             )
 
-            if not raw_mutations:
-                return []
-
-            mutations = []
-            for mut in raw_mutations:
-                try:
-                    study_id = mut.get(
-                        "molecularProfileId", ""
-                    ).replace("_mutations", "")
-
-                    mutations.append(
-                        MutationHit(
-                            study_id=study_id,
-                            molecular_profile_id=mut.get(
-                                "molecularProfileId", ""
-                            ),
-                            protein_change=mut.get(
-                                "proteinChange", ""
-                            ),
-                            mutation_type=mut.get(
-                                "mutationType", ""
-                            ),
-                            start_position=mut.get("startPosition"),
-                            end_position=mut.get("endPosition"),
-                            reference_allele=mut.get(
-                                "referenceAllele"
-                            ),
-                            variant_allele=mut.get("variantAllele"),
-                            sample_id=mut.get("sampleId"),
-                        )
-                    )
-                except Exception as e:
-                    logger.debug(f"Failed to parse mutation: {e}")
-                    continue
-
-            return mutations
+            return [mut for mut in raw_mutations if _is_valid_record(mut)]
 
         except Exception as e:
             logger.error(f"Error fetching mutations: {e}")
@@ -239,34 +233,49 @@ class CBioPortalMutationClient(CBioPortalCoreClient):
 
             cancer_type_client = get_cancer_type_client()
 
-            async def _resolve_cancer_type(
-                s: dict[str, Any],
-            ) -> str:
-                ct_id = s.get("cancerTypeId", "")
-                if ct_id and ct_id != "unknown":
-                    return await (
-                        cancer_type_client.get_cancer_type_name(
-                            ct_id
-                        )
-                    )
-                return await (
-                    cancer_type_client.get_study_cancer_type(
-                        s["studyId"]
-                    )
-                )
-
             # API returns list but adapter types as dict
             study_list: list[dict[str, Any]] = (
                 studies
                 if isinstance(studies, list)
                 else [studies]
             )
-            cancer_types = await asyncio.gather(
-                *(
-                    _resolve_cancer_type(s)
-                    for s in study_list
+
+            # Many studies share a cancer type: resolve each ID once.
+            # Sequential awaits load the cancer-type table a single time
+            # instead of once per concurrent caller.
+            ct_names = {
+                ct_id: await cancer_type_client.get_cancer_type_name(ct_id)
+                for ct_id in dict.fromkeys(
+                    _cancer_type_id(s) for s in study_list
                 )
+                if ct_id
+            }
+
+            # Studies without a usable ID need their own lookup; bound
+            # how many of those requests are in flight at once.
+            fallback_ids = [
+                s["studyId"] for s in study_list if not _cancer_type_id(s)
+            ]
+            sem = asyncio.Semaphore(STUDY_CANCER_TYPE_CONCURRENCY)
+
+            async def _study_cancer_type(study_id: str) -> str:
+                async with sem:
+                    return await cancer_type_client.get_study_cancer_type(
+                        study_id
+                    )
+
+            fallback_names = await asyncio.gather(
+                *(_study_cancer_type(study_id) for study_id in fallback_ids)
+            )
+            study_cts = dict(
+                zip(fallback_ids, fallback_names, strict=True)
             )
+            cancer_types = [
+                ct_names[ct_id]
+                if (ct_id := _cancer_type_id(s))
+                else study_cts[s["studyId"]]
+                for s in study_list
+            ]
 
             return {
                 s["studyId"]: {
@@ -283,35 +292,104 @@ class CBioPortalMutationClient(CBioPortalCoreClient):
 
     def _aggregate_by_study(
         self,
-        mutations: list[MutationHit],
+        mutations: list[dict[str, Any]],
         studies_info: dict[str, dict[str, Any]],
-    ) -> dict[str, StudyMutationSummary]:
-        """Aggregate mutations by study."""
-        study_mutations = defaultdict(list)
-        study_samples = defaultdict(set)
+        mutation_filter: MutationFilter | None = None,
+    ) -> tuple[dict[str, StudyMutationSummary], Counter[str]]:
+        """Aggregate raw mutation records by study in a single pass.
+
+        Records rejected by ``mutation_filter`` are skipped. Per study
+        this keeps the mutation count, the first five unique protein
+        changes and the set of sample IDs; protein changes are also
+        counted across all studies.
+        """
+        stats: dict[str, tuple[list[int], list[str], set[str]]] = {}
+        mutation_types: Counter[str] = Counter()
+        matches = mutation_filter.matches if mutation_filter else None
 
         for mut in mutations:
-            study_id = mut.study_id
-            study_mutations[study_id].append(mut.protein_change)
-            if mut.sample_id:
-                study_samples[study_id].add(mut.sample_id)
+            protein_change = mut.get("proteinChange", "")
+            if matches is not None and not matches(protein_change):
+                continue
+            mutation_types[protein_change] += 1
+            study_id = mut.get("molecularProfileId", "").removesuffix(
+                "_mutations"
+            )
+            entry = stats.get(study_id)
+            if entry is None:
+                entry = stats[study_id] = ([0], [], set())
+            count, unique_mutations, samples = entry
+            count[0] += 1
+            if (
+                len(unique_mutations) < 5
+                and protein_change not in unique_mutations
+            ):
+                unique_mutations.append(protein_change)
+            sample_id = mut.get("sampleId")
+            if sample_id:
+                samples.add(sample_id)
 
         # Create summaries
         summaries = {}
-        for study_id, mutations_list in study_mutations.items():
+        for study_id, (count, unique_mutations, samples) in stats.items():
             info = studies_info.get(study_id, {})
             summaries[study_id] = StudyMutationSummary(
                 study_id=study_id,
                 study_name=info.get("name", study_id),
                 cancer_type=info.get("cancer_type", "unknown"),
-                mutation_count=len(mutations_list),
-                sample_count=len(study_samples[study_id]),
-                mutations=list(set(mutations_list))[
-                    :5
-                ],  # Top 5 unique mutations
+                mutation_count=count[0],
+                sample_count=len(samples),
+                mutations=unique_mutations,  # Top 5 unique mutations
             )
 
-        return summaries
+        return summaries, mutation_types
+
+
+def _is_valid_record(mut: dict[str, Any]) -> bool:
+    """Return True if a raw mutation record has usable field types."""
+    return (
+        all(
+            isinstance(mut.get(field, ""), str)
+            for field in _REQUIRED_STR_FIELDS
+        )
+        and all(
+            isinstance(mut.get(field), str | None)
+            for field in _OPTIONAL_STR_FIELDS
+        )
+        and all(
+            _is_optional_int(mut.get(field))
+            for field in _OPTIONAL_INT_FIELDS
+        )
+    )
+
+
+def _is_optional_int(value: Any) -> bool:
+    """Return True if ``value`` validates as ``int | None``."""
+    if value is None or isinstance(value, int):
+        return True
+    try:
+        _OPTIONAL_INT.validate_python(value)
+    except ValidationError:
+        return False
+    return True
+
+
+def _cancer_type_id(study: dict[str, Any]) -> str:
+    """Return the study's cancer type ID, or "" if it has none."""
+    ct_id = study.get("cancerTypeId", "")
+    return "" if ct_id == "unknown" else ct_id
+
+
+_STUDY_TABLE_HEADER = (
+    "\n**Top Studies by Mutation Count:**\n"
+    "| Count | Study ID | Cancer Type | Study Name |\n"
+    "|-------|----------|-------------|------------|"
+)
+
+
+def _truncate(text: str, width: int) -> str:
+    """Cut text to ``width`` characters, marking the cut with "..."."""
+    return text if len(text) <= width else f"{text[:width]}..."
 
 
 def format_mutation_search_result(result: MutationSearchResult) -> str:
@@ -330,29 +408,20 @@ def format_mutation_search_result(result: MutationSearchResult) -> str:
     ])
 
     if result.top_studies:
-        lines.append("\n**Top Studies by Mutation Count:**")
-        lines.append("| Count | Study ID | Cancer Type | Study Name |")
-        lines.append("|-------|----------|-------------|------------|")
-
-        for study in result.top_studies[:10]:
-            study_id = (
-                study.study_id[:20] + "..."
-                if len(study.study_id) > 20
-                else study.study_id
-            )
-            study_name = (
-                study.study_name[:40] + "..."
-                if len(study.study_name) > 40
-                else study.study_name
-            )
-            lines.append(
-                f"| {study.mutation_count:5d} | {study_id:<20} | "
-                f"{study.cancer_type:<11} | {study_name} |"
-            )
+        lines.append(_STUDY_TABLE_HEADER)
+        lines.extend(
+            f"| {study.mutation_count:5d} "
+            f"| {_truncate(study.study_id, 20):<20} "
+            f"| {study.cancer_type:<11} "
+            f"| {_truncate(study.study_name, 40)} |"
+            for study in islice(result.top_studies, 10)
+        )
 
     if result.mutation_types and len(result.mutation_types) > 1:
         lines.append("\n**Mutation Types Found:**")
-        for mut_type, count in list(result.mutation_types.items())[:5]:
-            lines.append(f"- {mut_type}: {count} occurrences")
+        lines.extend(
+            f"- {mut_type}: {count} occurrences"
+            for mut_type, count in islice(result.mutation_types.items(), 5)
+        )
 
     return "\n".join(lines)
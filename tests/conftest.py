@@ -207,3 +207,13 @@ def mock_pubtator3_http(monkeypatch):
 
     monkeypatch.setattr(http_client, "call_http", fake_call_http)
     yield
+
+
+@pytest.fixture(autouse=True)
+def clear_sukl_parsed_cache():
+    """Keep parsed SUKL responses from leaking between tests."""
+    from czechmedmcp.czech.sukl import client
+
+    client._PARSED_CACHE.cache.clear()
+    yield
+    client._PARSED_CACHE.cache.clear()
@@ -1,6 +1,10 @@
 """Tests for diacritics normalization utility."""
 
-from czechmedmcp.czech.diacritics import normalize_query, strip_diacritics
+from czechmedmcp.czech.diacritics import (
+    normalize_query,
+    normalize_text,
+    strip_diacritics,
+)
 
 
 class TestStripDiacritics:
@@ -26,6 +30,10 @@ class TestStripDiacritics:
         assert strip_diacritics("čďěňřšťžú") == "cdenrstzu"
         assert strip_diacritics("ČĎĚŇŘŠŤŽÚ") == "cdenrstzu"
 
+    def test_non_czech_diacritics(self):
+        assert strip_diacritics("Müller Ångström") == "muller angstrom"
+        assert strip_diacritics("Łódź") == "łodz"
+
     def test_numbers_and_special(self):
         assert strip_diacritics("J06.9") == "j06.9"
         assert strip_diacritics("M01AE01") == "m01ae01"
@@ -42,3 +50,20 @@ class TestNormalizeQuery:
         assert normalize_query("léky") == normalize_query("leky")
         assert normalize_query("Ústí") == normalize_query("Usti")
         assert normalize_query("říjen") == normalize_query("rijen")
+
+    def test_repeated_queries_cached(self):
+        normalize_query.cache_clear()
+        normalize_query("Praha")
+        normalize_query("Praha")
+        assert normalize_query.cache_info().hits == 1
+
+
+class TestNormalizeText:
+    def test_matches_query_normalization(self):
+        for text in ("  Ústí nad Labem ", "léky", "ICO 123"):
+            assert normalize_text(text) == normalize_query(text)
+
+    def test_does_not_fill_query_cache(self):
+        normalize_query.cache_clear()
+        normalize_text("Praha")
+        assert normalize_query.cache_info().currsize == 0
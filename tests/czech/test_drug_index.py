@@ -7,6 +7,7 @@ import pytest
 from czechmedmcp.czech.sukl.drug_index import (
     DrugIndex,
     _detail_to_entry,
+    _get_postings,
     get_drug_index,
     reset_drug_index,
     search_index,
@@ -152,6 +153,40 @@ class TestSearchIndex:
         results, total = search_index(index, "ibuprofén")
         assert total == 1
 
+    def test_trigram_lookup_matches_scan(self):
+        """Posting lookups return what a full scan would, in order."""
+        details = [
+            {**SAMPLE_DETAIL_PARALEN, "kodSUKL": f"{i:07d}"}
+            for i in range(20)
+        ] + [SAMPLE_DETAIL_IBUPROFEN, SAMPLE_DETAIL_NUROFEN]
+        idx = DrugIndex()
+        idx._entries = [_detail_to_entry(d) for d in details]
+
+        for query in ("ibuprofen", "400mg", "M01AE01", "aliud", "fen"):
+            results, total = search_index(idx, query, page_size=50)
+            q = query.lower()
+            expected = [
+                e
+                for e in idx._entries
+                if q in e.name_normalized
+                or q == e.atc_normalized
+                or q in e.supplement_normalized
+                or q in e.holder_code
+            ]
+            assert results == expected
+            assert total == len(expected)
+
+    def test_postings_follow_entry_list(self, index):
+        """Postings are built once and rebuilt for new entries."""
+        postings = _get_postings(index)
+        search_index(index, "paralen")
+        assert _get_postings(index) is postings
+
+        index._entries = index._entries[:1]
+        assert _get_postings(index) is not postings
+        _, total = search_index(index, "paralen")
+        assert total == 0
+
 
 class TestDrugIndex:
     @pytest.fixture(autouse=True)
@@ -238,6 +273,117 @@ class TestDrugIndex:
         await idx._build()
         assert idx.size == 2
 
+    @patch(
+        "czechmedmcp.czech.sukl.drug_index._fetch_drug_list",
+        new_callable=AsyncMock,
+        return_value=SAMPLE_CODES,
+    )
+    @patch(
+        "czechmedmcp.czech.sukl.drug_index.fetch_drug_detail",
+        side_effect=mock_fetch_detail,
+    )
+    async def test_disk_cache_round_trip(self, mock_detail, mock_list):
+        """Entries persisted after a build are reloaded as-is."""
+        with patch(
+            "czechmedmcp.czech.sukl.drug_index.cache_response"
+        ) as mock_cache:
+            built = DrugIndex()
+            await built._build()
+        payload = mock_cache.call_args[0][1]
+        assert isinstance(payload, bytes)
+
+        with patch(
+            "czechmedmcp.czech.sukl.drug_index.get_cached_response",
+            return_value=payload,
+        ):
+            loaded = DrugIndex()
+            await loaded._build()
+
+        assert loaded._entries == built._entries
+        assert loaded._revision == built._revision
+        assert mock_list.await_count == 1
+
+    @patch(
+        "czechmedmcp.czech.sukl.drug_index._fetch_drug_list",
+        new_callable=AsyncMock,
+        return_value=SAMPLE_CODES,
+    )
+    @patch(
+        "czechmedmcp.czech.sukl.drug_index.fetch_drug_detail",
+        side_effect=mock_fetch_detail,
+    )
+    async def test_refresh_keeps_entries_for_same_list(
+        self, mock_detail, mock_list
+    ):
+        """An unchanged code list skips re-fetching details."""
+        idx = DrugIndex()
+        await idx._build()
+        entries = idx._entries
+        idx._built_at = 0.0
+
+        await idx._build()
+        assert not idx.is_expired
+        assert idx._entries is entries
+        assert mock_detail.call_count == len(SAMPLE_CODES)
+
+        mock_list.return_value = SAMPLE_CODES[:2]
+        idx._built_at = 0.0
+        await idx._build()
+        assert idx.size == 2
+        assert mock_detail.call_count == len(SAMPLE_CODES) + 2
+
+    @patch(
+        "czechmedmcp.czech.sukl.drug_index._fetch_drug_list",
+        new_callable=AsyncMock,
+        return_value=SAMPLE_CODES,
+    )
+    @patch(
+        "czechmedmcp.czech.sukl.drug_index.fetch_drug_detail",
+        side_effect=mock_fetch_detail,
+    )
+    async def test_refresh_refetches_aged_entries(
+        self, mock_detail, mock_list
+    ):
+        """Entries past the detail cache TTL are fetched again."""
+        idx = DrugIndex()
+        await idx._build()
+        idx._built_at = idx._fetched_at = 0.0
+
+        await idx._build()
+        assert mock_detail.call_count == 2 * len(SAMPLE_CODES)
+
+
+    @patch(
+        "czechmedmcp.czech.sukl.drug_index._fetch_drug_list",
+        new_callable=AsyncMock,
+        return_value=SAMPLE_CODES,
+    )
+    @patch(
+        "czechmedmcp.czech.sukl.drug_index.fetch_drug_detail",
+        side_effect=mock_fetch_detail,
+    )
+    async def test_refresh_refetches_after_partial_build(
+        self, mock_detail, mock_list
+    ):
+        """A build that missed details is not kept for the same list."""
+
+        async def _partial_fetch(code, **kwargs):
+            if code == "0005678":
+                return None
+            return DETAIL_MAP.get(code)
+
+        mock_detail.side_effect = _partial_fetch
+        idx = DrugIndex()
+        await idx._build()
+        assert idx.size == 2
+        assert idx._revision == ""
+
+        mock_detail.side_effect = mock_fetch_detail
+        idx._built_at = 0.0
+        await idx._build()
+        assert idx.size == 3
+        assert mock_detail.call_count == 2 * len(SAMPLE_CODES)
+        assert idx._revision
 
 class TestGetDrugIndex:
     @patch(
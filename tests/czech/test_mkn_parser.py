@@ -1,11 +1,13 @@
 """Unit tests for the MKN-10 CSV parser."""
 
 import json
+import pickle
+import zlib
 from unittest.mock import patch
 
 import pytest
 
-from czechmedmcp.czech.mkn.parser import _parse_csv
+from czechmedmcp.czech.mkn.parser import MknNode, _parse_csv
 
 # Minimal CSV sample matching the real MZ ČR open data schema
 SAMPLE_CSV = """\
@@ -32,41 +34,41 @@ class TestParseCSV:
         code_index, _ = _parse_csv(SAMPLE_CSV)
         assert "J00-J99" in code_index
         node = code_index["J00-J99"]
-        assert node["kind"] == "chapter"
-        assert "dýchací" in node["name_cs"]
+        assert node.kind == "chapter"
+        assert "dýchací" in node.name_cs
 
     def test_block_parsed(self):
         """Block code J06 is parsed with kind='block'."""
         code_index, _ = _parse_csv(SAMPLE_CSV)
         assert "J06" in code_index
         node = code_index["J06"]
-        assert node["kind"] == "block"
-        assert node["parent_code"] == "J00-J99"
+        assert node.kind == "block"
+        assert node.parent_code == "J00-J99"
 
     def test_subcategory_parsed(self):
         """Subcategory J06.9 is parsed with correct parent."""
         code_index, _ = _parse_csv(SAMPLE_CSV)
         assert "J06.9" in code_index
         node = code_index["J06.9"]
-        assert node["kind"] == "category"
-        assert node["parent_code"] == "J06"
+        assert node.kind == "category"
+        assert node.parent_code == "J06"
 
     def test_label_extraction_czech(self):
         """Czech labels are correctly extracted."""
         code_index, _ = _parse_csv(SAMPLE_CSV)
-        assert "Akutní" in code_index["J06"]["name_cs"]
-        assert "NS" in code_index["J06.9"]["name_cs"]
+        assert "Akutní" in code_index["J06"].name_cs
+        assert "NS" in code_index["J06.9"].name_cs
 
     def test_hierarchy_children(self):
         """Children are recorded correctly."""
         code_index, _ = _parse_csv(SAMPLE_CSV)
-        assert "J06" in code_index["J00-J99"]["children"]
-        assert "J06.9" in code_index["J06"]["children"]
+        assert "J06" in code_index["J00-J99"].children
+        assert "J06.9" in code_index["J06"].children
 
     def test_leaf_node_has_no_children(self):
         """J06.9 is a leaf and has no children."""
         code_index, _ = _parse_csv(SAMPLE_CSV)
-        assert code_index["J06.9"]["children"] == []
+        assert code_index["J06.9"].children == []
 
     def test_text_index_contains_words(self):
         """Text index is built from Czech labels."""
@@ -88,18 +90,48 @@ class TestParseCSV:
         all_codes = {c for codes in matching for c in codes}
         assert "J06" in all_codes or "J06.9" in all_codes
 
+    def test_text_index_postings_unique(self):
+        """Words repeated in one label index the code only once."""
+        _, text_index = _parse_csv(SAMPLE_CSV)
+        assert text_index["cholerae"] == ("A00.0",)
+        for codes in text_index.values():
+            assert len(codes) == len(set(codes))
+
     def test_expired_codes_excluded(self):
         """Codes with platnost_do are excluded."""
         code_index, _ = _parse_csv(SAMPLE_CSV)
         assert "Z99" not in code_index
 
+    def test_missing_columns_and_short_rows(self):
+        """Absent columns and truncated rows read as empty values."""
+        csv_text = (
+            "nazev,kod_tecka,kod_kapitola_rozsah\n"
+            '"Cholera",A00,A00-B99\n'
+            '"Tyfus",A01\n'
+        )
+        code_index, _ = _parse_csv(csv_text)
+        assert code_index["A00"].parent_code == "A00-B99"
+        assert code_index["A01"].parent_code == ""
+        assert code_index["A00-B99"].chapter_num == ""
+
+    def test_quoted_multiline_field(self):
+        """Quoted names spanning lines are parsed as one field."""
+        csv_text = (
+            "kod_tecka,nazev,kod_kapitola_rozsah\n"
+            'A00,"Cholera\nasijská",A00-B99\n'
+            "A01,Tyfus,A00-B99"
+        )
+        code_index, _ = _parse_csv(csv_text)
+        assert code_index["A00"].name_cs == "Cholera\nasijská"
+        assert code_index["A01"].name_cs == "Tyfus"
+
     def test_multiple_chapters(self):
         """Multiple chapters are created from distinct ranges."""
         code_index, _ = _parse_csv(SAMPLE_CSV)
         assert "J00-J99" in code_index
         assert "A00-B99" in code_index
-        assert code_index["J00-J99"]["kind"] == "chapter"
-        assert code_index["A00-B99"]["kind"] == "chapter"
+        assert code_index["J00-J99"].kind == "chapter"
+        assert code_index["A00-B99"].kind == "chapter"
 
 
 class TestLoadMkn10:
@@ -110,13 +142,11 @@ class TestLoadMkn10:
         """load_mkn10 returns cached result without download."""
         from czechmedmcp.czech.mkn.parser import load_mkn10
 
-        cached_payload = json.dumps(
-            {
-                "code_index": {
-                    "X": {"code": "X", "name_cs": "cached"},
-                },
-                "text_index": {},
-            }
+        cached_payload = zlib.compress(
+            pickle.dumps(
+                ({"X": MknNode("X", "cached", "block", None)}, {}),
+                protocol=5,
+            )
         )
         with patch(
             "czechmedmcp.czech.mkn.parser.get_cached_response",
@@ -124,6 +154,89 @@ class TestLoadMkn10:
         ):
             code_index, text_index = await load_mkn10()
         assert code_index == {
-            "X": {"code": "X", "name_cs": "cached"},
+            "X": MknNode("X", "cached", "block", None),
         }
         assert text_index == {}
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_entry_ignored(self):
+        """A non-pickle diskcache entry triggers a fresh parse."""
+        from unittest.mock import AsyncMock
+
+        from czechmedmcp.czech.mkn import parser
+
+        with (
+            patch.object(
+                parser,
+                "_download_csv",
+                new_callable=AsyncMock,
+                return_value=SAMPLE_CSV,
+            ) as mock_download,
+            patch.object(
+                parser,
+                "get_cached_response",
+                return_value=json.dumps({"code_index": {}}),
+            ),
+            patch.object(parser, "cache_response"),
+        ):
+            code_index, _ = await parser.load_mkn10()
+        mock_download.assert_awaited_once()
+        assert "J06.9" in code_index
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            b"not zlib data",
+            zlib.compress(b"not a pickle"),
+            zlib.compress(pickle.dumps({"code_index": {}}, protocol=5)),
+        ],
+    )
+    async def test_unreadable_payload_reparsed(self, payload):
+        """A corrupt or foreign pickle is a cache miss, not an error."""
+        from unittest.mock import AsyncMock
+
+        from czechmedmcp.czech.mkn import parser
+
+        with (
+            patch.object(
+                parser,
+                "_download_csv",
+                new_callable=AsyncMock,
+                return_value=SAMPLE_CSV,
+            ) as mock_download,
+            patch.object(
+                parser, "get_cached_response", return_value=payload
+            ),
+            patch.object(parser, "cache_response") as mock_store,
+        ):
+            code_index, _ = await parser.load_mkn10()
+        mock_download.assert_awaited_once()
+        mock_store.assert_called_once()
+        assert "J06.9" in code_index
+
+    @pytest.mark.asyncio
+    async def test_diskcache_round_trip(self):
+        """Indices written to diskcache load back unchanged."""
+        from unittest.mock import AsyncMock
+
+        from czechmedmcp.czech.mkn import parser
+
+        with (
+            patch.object(
+                parser,
+                "_download_csv",
+                new_callable=AsyncMock,
+                return_value=SAMPLE_CSV,
+            ),
+            patch.object(parser, "get_cached_response", return_value=None),
+            patch.object(parser, "cache_response") as mock_store,
+        ):
+            parsed = await parser.load_mkn10()
+
+        payload = mock_store.call_args[0][1]
+        with patch.object(
+            parser, "get_cached_response", return_value=payload
+        ):
+            loaded = await parser.load_mkn10()
+        assert loaded == parsed
@@ -130,6 +130,20 @@ class TestMknSearch:
         result = json.loads(await _mkn_search("J06.9"))
         assert result["query"] == "J06.9"
 
+    def test_text_match_is_substring_both_ways(self):
+        """Suffix lookup matches words inside and around the query."""
+        from czechmedmcp.czech.mkn.search import _search_by_text
+
+        # "infekc" is inside "infekce"; "infekcemi" contains "infekce".
+        for query in ("infekc", "infekcemi", "fekce", "cholerae01"):
+            expected = set()
+            for indexed_word, codes in _TEXT_INDEX.items():
+                if query in indexed_word or indexed_word in query:
+                    expected.update(codes)
+            found = _search_by_text(query, _CODE_INDEX, _TEXT_INDEX, 100)
+            assert {n.code for n in found} == expected
+            assert expected
+
 
 # -------------------------------------------------------------------
 # _mkn_get
@@ -194,6 +208,26 @@ class TestMknGet:
         assert isinstance(result["includes"], list)
         assert isinstance(result["excludes"], list)
 
+    def test_hierarchy_memoized_per_index(self):
+        """Ancestry is computed once per code and shared by children."""
+        import czechmedmcp.czech.mkn.search as search_mod
+
+        leaf = search_mod._resolve_hierarchy("J06.9", _CODE_INDEX)
+        assert leaf == {
+            "chapter": "J00-J99",
+            "chapter_name": "Nemoci dýchací soustavy",
+            "block": "J06",
+            "block_name": (
+                "Akutní infekce horních cest dýchacích"
+                " na více a neurčených místech"
+            ),
+            "category": "J06.9",
+        }
+        index, memo = search_mod._ANCESTRY_CACHE
+        assert index is _CODE_INDEX
+        assert {"J06.9", "J06", "J00-J99"} <= memo.keys()
+        assert "A00" not in memo
+
 
 # -------------------------------------------------------------------
 # _mkn_browse
@@ -160,6 +160,8 @@ class TestLookupNotFound:
                 "_download_csv",
                 new_callable=AsyncMock,
                 side_effect=Exception("conn fail"),
+            ), patch.object(
+                nrpzs_mod, "get_cached_response", return_value=None
             ):
                 result = json.loads(
                     await _nrpzs_get("10001")
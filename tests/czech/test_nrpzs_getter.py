@@ -94,3 +94,21 @@ class TestNrpzsGetter:
         result = json.loads(await _nrpzs_get("12345"))
         assert result["legal_form"] == "fyzická osoba"
         assert result["ico"] == "12345678"
+
+    @pytest.mark.asyncio
+    async def test_get_prefers_facility_id_and_first_row(self):
+        """ID beats ICO, and the first of duplicate IDs is returned."""
+        import czechmedmcp.czech.nrpzs.search as mod
+        from czechmedmcp.czech.nrpzs.search import _nrpzs_get
+
+        mod._PROVIDERS = [
+            {"ZZ_misto_poskytovani_ID": "1", "poskytovatel_ICO": "7",
+             "ZZ_nazev": "First"},
+            {"ZZ_misto_poskytovani_ID": "7", "poskytovatel_ICO": "8",
+             "ZZ_nazev": "By ID"},
+            {"ZZ_misto_poskytovani_ID": " 1 ", "ZZ_nazev": "Dup"},
+        ]
+
+        assert json.loads(await _nrpzs_get("7"))["name"] == "By ID"
+        assert json.loads(await _nrpzs_get("1"))["name"] == "First"
+        assert json.loads(await _nrpzs_get("8"))["name"] == "By ID"
@@ -128,6 +128,8 @@ class TestNrpzsSearch:
                 "_download_csv",
                 new_callable=AsyncMock,
                 side_effect=Exception("fail"),
+            ), patch.object(
+                mod, "get_cached_response", return_value=None
             ):
                 result = json.loads(
                     await _nrpzs_search(query="test")
@@ -135,3 +137,133 @@ class TestNrpzsSearch:
             assert "error" in result
         finally:
             mod._PROVIDERS = old
+
+    def test_search_columns_built_once_per_list(self):
+        """Normalized columns are reused until _PROVIDERS is replaced."""
+        import czechmedmcp.czech.nrpzs.search as mod
+
+        columns = mod._get_search_columns(mod._PROVIDERS)
+        assert columns.cities == ["praha", "brno"]
+        assert columns.names[0] == "mudr. jan novak"
+        assert mod._get_search_columns(mod._PROVIDERS) is columns
+
+        replaced = list(_MOCK_PROVIDERS[1:])
+        assert mod._get_search_columns(replaced).cities == ["brno"]
+
+
+class TestGetProviders:
+    """Tests for the pickled provider cache in _get_providers."""
+
+    @pytest.fixture(autouse=True)
+    def cold_module_cache(self):
+        import czechmedmcp.czech.nrpzs.search as mod
+
+        mod._PROVIDERS = None
+        mod._COLUMNS = None
+        yield
+        mod._COLUMNS = None
+
+    @pytest.mark.asyncio
+    async def test_parsed_cache_round_trip(self):
+        """A miss pickles rows and columns; a hit skips download."""
+        from unittest.mock import AsyncMock, patch
+
+        import czechmedmcp.czech.nrpzs.search as mod
+
+        csv_text = "ZZ_nazev,ZZ_obec\nNemocnice Brno,Brno\n"
+        with patch.object(
+            mod, "get_cached_response", return_value=None
+        ), patch.object(
+            mod,
+            "_download_csv",
+            new_callable=AsyncMock,
+            return_value=csv_text,
+        ), patch.object(mod, "cache_response") as mock_cache:
+            providers = await mod._get_providers()
+        payload = mock_cache.call_args[0][1]
+        assert isinstance(payload, bytes)
+
+        mod._PROVIDERS = None
+        mod._COLUMNS = None
+        with patch.object(
+            mod, "get_cached_response", return_value=payload
+        ), patch.object(
+            mod, "_download_csv", new_callable=AsyncMock
+        ) as mock_download:
+            cached = await mod._get_providers()
+        mock_download.assert_not_awaited()
+        assert cached == providers
+        assert mod._get_search_columns(cached).cities == ["brno"]
+        assert mod._COLUMNS is not None
+        assert mod._COLUMNS.rows is cached
+
+    @pytest.mark.asyncio
+    async def test_unreadable_parsed_cache_rebuilt(self):
+        """A truncated or incomplete pickle is reparsed, not raised."""
+        import pickle
+        from unittest.mock import AsyncMock, patch
+
+        import czechmedmcp.czech.nrpzs.search as mod
+
+        incomplete = mod._SearchColumns.__new__(mod._SearchColumns)
+        incomplete.rows = []
+        payloads = [
+            pickle.dumps(mod._get_search_columns([]), protocol=5)[:-5],
+            pickle.dumps(incomplete, protocol=5),
+        ]
+        csv_text = "ZZ_nazev,ZZ_obec\nNemocnice Brno,Brno\n"
+        for payload in payloads:
+            mod._PROVIDERS = None
+            mod._COLUMNS = None
+            with patch.object(
+                mod, "get_cached_response", return_value=payload
+            ), patch.object(
+                mod,
+                "_download_csv",
+                new_callable=AsyncMock,
+                return_value=csv_text,
+            ) as mock_download, patch.object(
+                mod, "cache_response"
+            ) as mock_cache:
+                providers = await mod._get_providers()
+            mock_download.assert_awaited_once()
+            mock_cache.assert_called_once()
+            assert providers[0]["ZZ_obec"] == "Brno"
+
+    def test_parse_csv_shares_repeated_values(self):
+        """Low-cardinality columns reuse one string per value."""
+        import czechmedmcp.czech.nrpzs.search as mod
+
+        rows = mod._parse_csv(
+            "ZZ_nazev,ZZ_obec,ZZ_kraj_nazev\n"
+            "A,Brno,Jihomoravský kraj\n"
+            "B,Brno,Jihomoravský kraj\n"
+        )
+        assert rows[0]["ZZ_obec"] is rows[1]["ZZ_obec"]
+        assert rows[0]["ZZ_kraj_nazev"] is rows[1]["ZZ_kraj_nazev"]
+        assert rows[1]["ZZ_nazev"] == "B"
+
+    @pytest.mark.asyncio
+    async def test_download_uses_shared_pool(self):
+        """The CSV is fetched through the pooled client, not a new one."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        import czechmedmcp.czech.nrpzs.search as mod
+
+        client = MagicMock()
+        client.get = AsyncMock(
+            return_value=MagicMock(text="ZZ_nazev\nA\n")
+        )
+        with patch.object(
+            mod, "get_cached_response", return_value=None
+        ), patch.object(mod, "cache_response"), patch.object(
+            mod,
+            "get_connection_pool",
+            new_callable=AsyncMock,
+            return_value=client,
+        ) as mock_pool:
+            text = await mod._download_csv()
+
+        assert text == "ZZ_nazev\nA\n"
+        mock_pool.assert_awaited_once()
+        assert client.get.call_args.kwargs["follow_redirects"] is True
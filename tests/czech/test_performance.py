@@ -191,7 +191,7 @@ E11,"Diabetes mellitus 2. typu",E00-E90,IV,"Nemoci zlaz",
 
         for code, expected_name in known_codes.items():
             cls = code_index.get(code)
-            if cls and cls.get("name_cs") == expected_name:
+            if cls and cls.name_cs == expected_name:
                 correct += 1
 
         accuracy = correct / total
@@ -0,0 +1,70 @@
+"""Tests for the shared SZV/VZP column search."""
+
+import sys
+
+from czechmedmcp.czech.search_columns import (
+    FIELD_SEP,
+    build_search_columns,
+    intern_columns,
+    matching_rows,
+)
+
+_FIELDS = (
+    lambda r: r["code"].lower(),
+    lambda r: r["name"],
+    lambda r: r["area"],
+)
+
+_ROWS = [
+    {"code": " 09513", "name": "ekg 12ti svodove", "area": "101"},
+    {"code": "12345", "name": "vysetreni", "area": "102"},
+    {"code": "09513", "name": "duplicate", "area": "103"},
+]
+
+
+def _columns(rows):
+    return build_search_columns(
+        rows, code=lambda r: r["code"], fields=_FIELDS
+    )
+
+
+class TestBuildSearchColumns:
+    def test_text_lines_up_with_rows(self):
+        columns = _columns(_ROWS)
+        row = columns.text[columns.starts[1] : columns.starts[2]]
+        assert row.split(FIELD_SEP) == ["12345", "vysetreni", "102", ""]
+
+    def test_by_code_keeps_first_row(self):
+        by_code = _columns(_ROWS).by_code
+        assert by_code["09513"] is _ROWS[0]
+        assert by_code["12345"] is _ROWS[1]
+
+    def test_intern_columns_skips_non_strings(self):
+        row = {"a": "".join(["x", "y"]), "b": 5}
+        intern_columns(row, ("a", "b", "missing"))
+        assert row["a"] is sys.intern("xy")
+        assert row == {"a": "xy", "b": 5}
+
+
+class TestMatchingRows:
+    def test_agrees_with_row_scan(self):
+        rows = [
+            {**r, "code": f"{i:05d}"} for i in range(5) for r in _ROWS
+        ]
+        columns = _columns(rows)
+        for query in ("ekg", "0000", "10", "vysetreni", "", "zzz"):
+            expected = [
+                i
+                for i, row in enumerate(rows)
+                if any(query in f(row) for f in _FIELDS)
+            ]
+            assert matching_rows(columns, query, 100) == expected
+            assert matching_rows(columns, query, 3) == expected[:3]
+
+    def test_separator_in_query_matches_nothing(self):
+        columns = _columns(_ROWS)
+        assert matching_rows(columns, "102" + FIELD_SEP, 10) == []
+        assert matching_rows(columns, FIELD_SEP, 10) == []
+
+    def test_empty_columns(self):
+        assert matching_rows(_columns([]), "ekg", 10) == []
@@ -104,6 +104,10 @@ class TestSuklAvailability:
             "czechmedmcp.czech.sukl.availability._fetch_drug_detail",
             new_callable=AsyncMock,
             return_value=None,
+        ), patch(
+            "czechmedmcp.czech.sukl.availability._check_distribution",
+            new_callable=AsyncMock,
+            return_value="unavailable",
         ):
             result = json.loads(
                 await _sukl_availability_check("9999999")
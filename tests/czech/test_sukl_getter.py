@@ -105,15 +105,16 @@ class TestFetchComposition:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".cache_response",
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_composition("0000123")
@@ -136,12 +137,13 @@ class TestFetchComposition:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".get_cached_response",
             return_value=None,
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_composition("9999999")
@@ -164,12 +166,13 @@ class TestFetchComposition:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".get_cached_response",
             return_value=None,
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_composition("0000123")
@@ -182,7 +185,7 @@ class TestFetchComposition:
 
         cached = json.dumps(COMPOSITION)
         with patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".get_cached_response",
             return_value=cached,
         ):
@@ -207,19 +210,34 @@ class TestFetchComposition:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".cache_response",
-        ), patch(
+        ) as mock_cache, patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_composition("0000123")
             assert result == []
+            assert mock_cache.call_args[0][1] == "[]"
+
+    async def test_coerces_cached_non_list(self):
+        from czechmedmcp.czech.sukl.getter import (
+            _fetch_composition,
+        )
+
+        with patch(
+            "czechmedmcp.czech.sukl.client"
+            ".get_cached_response",
+            return_value=json.dumps({"key": "val"}),
+        ):
+            result = await _fetch_composition("0000123")
+            assert result == []
 
 
 # ============================================================
@@ -246,15 +264,16 @@ class TestFetchDocMetadata:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".cache_response",
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_doc_metadata("0000123")
@@ -276,15 +295,16 @@ class TestFetchDocMetadata:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".cache_response",
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_doc_metadata(
@@ -310,12 +330,13 @@ class TestFetchDocMetadata:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".get_cached_response",
             return_value=None,
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_doc_metadata("9999999")
@@ -338,12 +359,13 @@ class TestFetchDocMetadata:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.getter"
+            "czechmedmcp.czech.sukl.client"
             ".get_cached_response",
             return_value=None,
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_doc_metadata("0000123")
@@ -400,7 +422,8 @@ class TestUrlIsReachable:
 
         with patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             assert await _url_is_reachable(
@@ -424,7 +447,8 @@ class TestUrlIsReachable:
 
         with patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             assert not await _url_is_reachable(
@@ -449,7 +473,8 @@ class TestUrlIsReachable:
 
         with patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             assert not await _url_is_reachable(
@@ -494,7 +519,8 @@ class TestFetchSubstanceName:
             ".cache_response",
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             name = await _fetch_substance_name(1234)
@@ -526,7 +552,8 @@ class TestFetchSubstanceName:
             ".cache_response",
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             name = await _fetch_substance_name(5678)
@@ -554,7 +581,8 @@ class TestFetchSubstanceName:
             return_value=None,
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             name = await _fetch_substance_name(9999)
@@ -582,7 +610,8 @@ class TestFetchSubstanceName:
             return_value=None,
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             name = await _fetch_substance_name(1234)
@@ -814,6 +843,16 @@ class TestSuklDrugDetails:
             "._fetch_drug_detail",
             new_callable=AsyncMock,
             return_value=None,
+        ), patch(
+            "czechmedmcp.czech.sukl.getter"
+            "._fetch_composition",
+            new_callable=AsyncMock,
+            return_value=[],
+        ), patch(
+            "czechmedmcp.czech.sukl.getter"
+            "._fetch_doc_metadata",
+            new_callable=AsyncMock,
+            return_value=[],
         ):
             raw = await _sukl_drug_details("9999999")
             result = json.loads(raw)
@@ -821,6 +860,49 @@ class TestSuklDrugDetails:
         assert "error" in result
         assert "9999999" in result["error"]
 
+    async def test_lookups_run_concurrently(self):
+        """Detail waits on the other lookups, so all must overlap."""
+        import asyncio
+
+        from czechmedmcp.czech.sukl.getter import (
+            _sukl_drug_details,
+        )
+
+        started = asyncio.Event()
+
+        async def slow_detail(code):
+            await asyncio.wait_for(started.wait(), 1)
+            return DRUG_DETAIL
+
+        async def composition(code):
+            started.set()
+            return COMPOSITION
+
+        with patch(
+            "czechmedmcp.czech.sukl.getter"
+            "._fetch_drug_detail",
+            new=slow_detail,
+        ), patch(
+            "czechmedmcp.czech.sukl.getter"
+            "._fetch_composition",
+            new=composition,
+        ), patch(
+            "czechmedmcp.czech.sukl.getter"
+            "._fetch_doc_metadata",
+            new_callable=AsyncMock,
+            return_value=DOC_META_BOTH,
+        ), patch(
+            "czechmedmcp.czech.sukl.getter"
+            "._resolve_substance_names",
+            new_callable=AsyncMock,
+            return_value={},
+        ):
+            raw = await _sukl_drug_details("0000123")
+
+        result = json.loads(raw)
+        assert result["name"] == "NUROFEN 400MG"
+        assert len(result["active_substances"]) == 2
+
     async def test_no_doc_metadata_fallback_reachable(
         self,
     ):
@@ -960,7 +1042,8 @@ class TestFetchDocHtml:
             ".cache_response",
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_doc_html(
@@ -989,7 +1072,8 @@ class TestFetchDocHtml:
             return_value=None,
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_doc_html(
@@ -1019,7 +1103,8 @@ class TestFetchDocHtml:
             return_value=None,
         ), patch(
             "czechmedmcp.czech.sukl.getter"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_doc_html(
@@ -1429,6 +1514,11 @@ class TestSuklDocumentGetter:
             "._fetch_drug_detail",
             new_callable=AsyncMock,
             return_value=None,
+        ), patch(
+            "czechmedmcp.czech.sukl.getter"
+            "._fetch_doc_metadata",
+            new_callable=AsyncMock,
+            return_value=[],
         ):
             raw = await _sukl_spc_getter("9999999")
             result = json.loads(raw)
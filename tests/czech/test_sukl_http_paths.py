@@ -47,7 +47,8 @@ class TestFetchDrugList:
             return_value=None,
         ), patch(
             "czechmedmcp.czech.sukl.drug_index"
-            ".httpx.AsyncClient",
+            ".get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ), patch(
             "czechmedmcp.czech.sukl.drug_index.cache_response",
@@ -56,6 +57,19 @@ class TestFetchDrugList:
             assert result == ["001", "002"]
 
 
+class TestGetSuklClient:
+    """Cover the pooled client in client.py."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_within_loop(self):
+        from czechmedmcp.czech.sukl.client import get_sukl_client
+
+        first = await get_sukl_client()
+        second = await get_sukl_client()
+        assert first is second
+        assert not first.is_closed
+
+
 class TestFetchDrugDetailClient:
     """Cover fetch_drug_detail in client.py."""
 
@@ -73,6 +87,23 @@ class TestFetchDrugDetailClient:
             result = await fetch_drug_detail("001")
             assert result["kodSukl"] == "001"
 
+    @pytest.mark.asyncio
+    async def test_cached_payload_parsed_once(self):
+        from czechmedmcp.czech.sukl.client import (
+            fetch_drug_detail,
+        )
+
+        data = {"kodSukl": "001", "nazev": "Test"}
+        with patch(
+            "czechmedmcp.czech.sukl.client.get_cached_response",
+            return_value=json.dumps(data),
+        ) as mock_get:
+            first = await fetch_drug_detail("001")
+            second = await fetch_drug_detail("001")
+
+        assert first is second
+        mock_get.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_fetch_from_api(self):
         from czechmedmcp.czech.sukl.client import (
@@ -96,7 +127,8 @@ class TestFetchDrugDetailClient:
             "czechmedmcp.czech.sukl.client.get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.client.httpx.AsyncClient",
+            "czechmedmcp.czech.sukl.client.get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ), patch(
             "czechmedmcp.czech.sukl.client.cache_response",
@@ -104,6 +136,45 @@ class TestFetchDrugDetailClient:
             result = await fetch_drug_detail("001")
             assert result["kodSukl"] == "001"
 
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_share_request(self):
+        import asyncio
+
+        from czechmedmcp.czech.sukl import client
+
+        data = {"kodSukl": "001", "nazev": "Test"}
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = data
+        mock_resp.raise_for_status = MagicMock()
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_resp
+
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = slow_get
+
+        with patch(
+            "czechmedmcp.czech.sukl.client.get_cached_response",
+            return_value=None,
+        ), patch(
+            "czechmedmcp.czech.sukl.client.get_sukl_client",
+            new_callable=AsyncMock,
+            return_value=mock_client,
+        ), patch(
+            "czechmedmcp.czech.sukl.client.cache_response",
+        ):
+            results = await asyncio.gather(
+                client.fetch_drug_detail("001"),
+                client.fetch_drug_detail("0000001"),
+                client.fetch_drug_detail("001"),
+            )
+
+        assert all(r == data for r in results)
+        assert mock_client.get.await_count == 1
+        assert not client._INFLIGHT
+
     @pytest.mark.asyncio
     async def test_fetch_404(self):
         from czechmedmcp.czech.sukl.client import (
@@ -124,7 +195,8 @@ class TestFetchDrugDetailClient:
             "czechmedmcp.czech.sukl.client.get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.client.httpx.AsyncClient",
+            "czechmedmcp.czech.sukl.client.get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await fetch_drug_detail("999")
@@ -171,7 +243,8 @@ class TestFetchDrugDetailGetter:
             "czechmedmcp.czech.sukl.client.get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.client.httpx.AsyncClient",
+            "czechmedmcp.czech.sukl.client.get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ), patch(
             "czechmedmcp.czech.sukl.client.cache_response",
@@ -199,7 +272,8 @@ class TestFetchDrugDetailGetter:
             "czechmedmcp.czech.sukl.client.get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.client.httpx.AsyncClient",
+            "czechmedmcp.czech.sukl.client.get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_drug_detail("999")
@@ -228,10 +302,11 @@ class TestFetchDrugDetailGetter:
             "czechmedmcp.czech.sukl.client.get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.getter.httpx.AsyncClient",
+            "czechmedmcp.czech.sukl.getter.get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ), patch(
-            "czechmedmcp.czech.sukl.getter.cache_response",
+            "czechmedmcp.czech.sukl.client.cache_response",
         ):
             result = await _fetch_composition("001")
             assert len(result) == 1
@@ -259,10 +334,81 @@ class TestFetchDrugDetailGetter:
             "czechmedmcp.czech.sukl.client.get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.getter.httpx.AsyncClient",
+            "czechmedmcp.czech.sukl.getter.get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ), patch(
-            "czechmedmcp.czech.sukl.getter.cache_response",
+            "czechmedmcp.czech.sukl.client.cache_response",
         ):
             result = await _fetch_doc_metadata("001")
             assert len(result) == 1
+
+
+class TestParsedCacheSharing:
+    """Cover the in-process parsed payload cache in client.py."""
+
+    @pytest.fixture(autouse=True)
+    def empty_parsed_cache(self):
+        from czechmedmcp.czech.sukl import client
+
+        client._PARSED_CACHE.cache.clear()
+        yield
+        client._PARSED_CACHE.cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_parsed_entry_never_outlives_disk_ttl(self):
+        from czechmedmcp.czech.sukl import client
+
+        with patch.object(client, "cache_response"), patch.object(
+            client._PARSED_CACHE, "set", new_callable=AsyncMock
+        ) as mock_set:
+            await client.cache_json("short", {"a": 1}, 60)
+            await client.cache_json("long", {"a": 1}, 86400)
+        assert [c.args[2] for c in mock_set.call_args_list] == [
+            60,
+            client._PARSED_CACHE_TTL,
+        ]
+
+        with patch.object(
+            client, "get_cached_response", return_value='{"a": 1}'
+        ), patch.object(
+            client._PARSED_CACHE, "set", new_callable=AsyncMock
+        ) as mock_set:
+            await client.get_cached_json("disk", 30)
+        assert mock_set.call_args.args[2] == 30
+
+    @pytest.mark.asyncio
+    async def test_consumers_leave_shared_payloads_unchanged(self):
+        import copy
+
+        from czechmedmcp.czech.sukl import client, getter
+        from czechmedmcp.http_client import generate_cache_key
+
+        code = "0000001"
+        payloads = {
+            f"lecive-pripravky/{code}": {
+                "kodSUKL": code,
+                "nazev": "Test",
+                "sila": "10MG",
+            },
+            f"slozeni/{code}": [
+                {"kodLatky": 5, "nazevLatky": "TEST", "mnozstvi": "10"}
+            ],
+            f"dokumenty-metadata/{code}": [
+                {"typ": "spc", "idDokumentu": "D1"},
+                {"typ": "pil", "idDokumentu": "D2"},
+            ],
+        }
+        with patch.object(client, "cache_response"):
+            for path, data in payloads.items():
+                key = generate_cache_key(
+                    "GET", f"{client.SUKL_DLP_V1}/{path}", {}
+                )
+                await client.cache_json(key, data, 3600)
+        expected = copy.deepcopy(payloads)
+
+        result = json.loads(await getter._sukl_drug_details(code))
+
+        assert result["name"] == "Test"
+        assert result["active_substances"]
+        assert payloads == expected
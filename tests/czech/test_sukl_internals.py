@@ -213,10 +213,11 @@ class TestSuklGetterInternals:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.getter.get_cached_response",
+            "czechmedmcp.czech.sukl.client.get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.getter.httpx.AsyncClient",
+            "czechmedmcp.czech.sukl.getter.get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_doc_metadata("9999999")
@@ -241,10 +242,11 @@ class TestSuklGetterInternals:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.getter.get_cached_response",
+            "czechmedmcp.czech.sukl.client.get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.getter.httpx.AsyncClient",
+            "czechmedmcp.czech.sukl.getter.get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ):
             result = await _fetch_composition("9999999")
@@ -273,13 +275,14 @@ class TestSuklAvailabilityInternals:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.availability.get_cached_response",
+            "czechmedmcp.czech.sukl.client.get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.availability.httpx.AsyncClient",
+            "czechmedmcp.czech.sukl.availability.get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ), patch(
-            "czechmedmcp.czech.sukl.availability.cache_response",
+            "czechmedmcp.czech.sukl.client.cache_response",
         ):
             result = await _check_distribution("9999999")
             assert result == "unavailable"
@@ -304,13 +307,14 @@ class TestSuklAvailabilityInternals:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.availability.get_cached_response",
+            "czechmedmcp.czech.sukl.client.get_cached_response",
             return_value=None,
         ), patch(
-            "czechmedmcp.czech.sukl.availability.httpx.AsyncClient",
+            "czechmedmcp.czech.sukl.availability.get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ), patch(
-            "czechmedmcp.czech.sukl.availability.cache_response",
+            "czechmedmcp.czech.sukl.client.cache_response",
         ):
             result = await _check_distribution("0000123")
             assert result == "available"
@@ -322,7 +326,7 @@ class TestSuklAvailabilityInternals:
         )
 
         with patch(
-            "czechmedmcp.czech.sukl.availability.get_cached_response",
+            "czechmedmcp.czech.sukl.client.get_cached_response",
             return_value=json.dumps(
                 {"_status": "limited"}
             ),
@@ -71,7 +71,8 @@ def _mock_env(api_data=None):
 
     with (
         patch(
-            "czechmedmcp.czech.sukl.search.httpx.AsyncClient",
+            "czechmedmcp.czech.sukl.search.get_sukl_client",
+            new_callable=AsyncMock,
             return_value=mock_client,
         ),
         patch(
@@ -183,7 +184,8 @@ class TestFindPharmacies:
         with (
             patch(
                 "czechmedmcp.czech.sukl.search"
-                ".httpx.AsyncClient",
+                ".get_sukl_client",
+                new_callable=AsyncMock,
                 return_value=mock_client,
             ),
             patch(
@@ -250,7 +252,8 @@ class TestFindPharmacies:
         with (
             patch(
                 "czechmedmcp.czech.sukl.search"
-                ".httpx.AsyncClient",
+                ".get_sukl_client",
+                new_callable=AsyncMock,
                 return_value=mock_client,
             ),
             patch(
@@ -2,7 +2,7 @@
 
 import json
 from contextlib import contextmanager
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from czechmedmcp.czech.sukl.getter import (
     _sukl_pil_getter,
@@ -63,7 +63,7 @@ class MockResp:
 
 
 class MockClient:
-    """Mock httpx.AsyncClient."""
+    """Mock of the pooled SUKL HTTP client."""
 
     def __init__(self, responses=None):
         self._responses = responses or {}
@@ -114,7 +114,8 @@ def _mock_env(
     with (
         patch(
             "czechmedmcp.czech.sukl.getter."
-            "httpx.AsyncClient",
+            "get_sukl_client",
+            new_callable=AsyncMock,
             return_value=client,
         ),
         patch(
@@ -126,6 +127,12 @@ def _mock_env(
             "czechmedmcp.czech.sukl.getter."
             "cache_response",
         ),
+        patch(
+            "czechmedmcp.czech.sukl.client."
+            "get_sukl_client",
+            new_callable=AsyncMock,
+            return_value=client,
+        ),
         patch(
             "czechmedmcp.czech.sukl.client."
             "get_cached_response",
@@ -1,7 +1,7 @@
 """Tests for SUKL reimbursement lookup."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from czechmedmcp.czech.sukl.reimbursement import _get_reimbursement
 
@@ -31,7 +31,7 @@ def _make_httpx_response(status_code, data=None):
 
 
 def _patch_http(status_code=200, data=None):
-    """Patch httpx.AsyncClient for reimbursement tests."""
+    """Patch the SUKL HTTP client for reimbursement tests."""
 
     resp = _make_httpx_response(status_code, data)
 
@@ -49,7 +49,8 @@ def _patch_http(status_code=200, data=None):
             return resp
 
     return patch(
-        "czechmedmcp.czech.sukl.reimbursement.httpx.AsyncClient",
+        "czechmedmcp.czech.sukl.reimbursement.get_sukl_client",
+        new_callable=AsyncMock,
         return_value=MockClient(),
     )
 
@@ -126,18 +126,14 @@ class TestSzvDownloadTimeout:
             return_value=None,
         ), patch(
             "czechmedmcp.czech.szv.search"
-            ".httpx.AsyncClient"
-        ) as mock_client_cls:
+            ".get_connection_pool",
+            new_callable=AsyncMock,
+        ) as mock_pool:
             mock_client = AsyncMock()
             mock_client.get.side_effect = (
                 httpx.TimeoutException("timeout")
             )
-            mock_client_cls.return_value.__aenter__ = (
-                AsyncMock(return_value=mock_client)
-            )
-            mock_client_cls.return_value.__aexit__ = (
-                AsyncMock(return_value=False)
-            )
+            mock_pool.return_value = mock_client
 
             from czechmedmcp.czech.szv.search import (
                 _download_excel,
@@ -177,8 +173,9 @@ class TestSzvHttp504:
             return_value=None,
         ), patch(
             "czechmedmcp.czech.szv.search"
-            ".httpx.AsyncClient"
-        ) as mock_client_cls:
+            ".get_connection_pool",
+            new_callable=AsyncMock,
+        ) as mock_pool:
             mock_client = AsyncMock()
             mock_client.get.return_value = mock_resp
             mock_client.get.return_value.raise_for_status = (
@@ -190,12 +187,7 @@ class TestSzvHttp504:
                     )
                 )
             )
-            mock_client_cls.return_value.__aenter__ = (
-                AsyncMock(return_value=mock_client)
-            )
-            mock_client_cls.return_value.__aexit__ = (
-                AsyncMock(return_value=False)
-            )
+            mock_pool.return_value = mock_client
 
             from czechmedmcp.czech.szv.search import (
                 _download_excel,
@@ -224,3 +216,137 @@ class TestSzvExcelParse:
         )
         assert "error" in result
         assert "not found" in result["error"]
+
+
+def _export_xlsx(rows: list[tuple]) -> bytes:
+    """Build an SZV-style workbook with an Export sheet."""
+    import io
+
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Export"
+    for row in rows:
+        ws.append(row)
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+class TestSzvDownloadCache:
+    """Parsed rows and columns are pickled and reloaded as-is."""
+
+    async def test_parsed_rows_round_trip(self):
+        from czechmedmcp.czech.szv.search import _download_excel
+
+        content = _export_xlsx([
+            ("Kód", "Název", "Celkové"),
+            ("09513", "EKG 12ti svodové", 113),
+            (None, "prázdný řádek", None),
+        ])
+        mock_client = AsyncMock()
+        mock_client.get.return_value = httpx.Response(
+            200,
+            content=content,
+            request=httpx.Request("GET", "http://x"),
+        )
+        with patch.object(
+            szv_mod, "get_cached_response", return_value=None
+        ), patch.object(
+            szv_mod, "cache_response"
+        ) as mock_cache, patch.object(
+            szv_mod,
+            "get_connection_pool",
+            new_callable=AsyncMock,
+            return_value=mock_client,
+        ):
+            procedures = await _download_excel()
+
+        assert procedures == [
+            {"Kód": "09513", "Název": "EKG 12ti svodové", "Celkové": 113}
+        ]
+        payload = mock_cache.call_args[0][1]
+        assert isinstance(payload, bytes)
+
+        with patch.object(
+            szv_mod, "get_cached_response", return_value=payload
+        ), patch.object(
+            szv_mod, "get_connection_pool", new_callable=AsyncMock
+        ) as mock_pool:
+            loaded = await _download_excel()
+        mock_pool.assert_not_awaited()
+        assert loaded == procedures
+        assert szv_mod._COLUMNS.rows is loaded
+        assert szv_mod._COLUMNS.text == "09513\x00ekg 12ti svodove\x00\x00"
+
+    async def test_unreadable_parsed_cache_rebuilt(self):
+        """A truncated or foreign pickle is reparsed, not raised."""
+        import pickle
+
+        from czechmedmcp.czech.szv.search import _download_excel
+
+        content = _export_xlsx([
+            ("Kód", "Název"),
+            ("09513", "EKG 12ti svodové"),
+        ])
+        payloads = [
+            pickle.dumps(szv_mod._get_search_columns([]), protocol=5)[:-5],
+            pickle.dumps([{"Kód": "stale"}], protocol=5),
+        ]
+        for payload in payloads:
+            mock_client = AsyncMock()
+            mock_client.get.return_value = httpx.Response(
+                200,
+                content=content,
+                request=httpx.Request("GET", "http://x"),
+            )
+            with patch.object(
+                szv_mod, "get_cached_response", return_value=payload
+            ), patch.object(
+                szv_mod, "cache_response"
+            ) as mock_cache, patch.object(
+                szv_mod,
+                "get_connection_pool",
+                new_callable=AsyncMock,
+                return_value=mock_client,
+            ):
+                procedures = await _download_excel()
+            mock_cache.assert_called_once()
+            assert procedures[0]["Kód"] == "09513"
+
+    async def test_concurrent_loads_share_download(self):
+        import asyncio
+
+        async def slow_download():
+            await asyncio.sleep(0.01)
+            return list(_MOCK_PROCEDURES)
+
+        with patch.object(
+            szv_mod, "_download_excel", side_effect=slow_download
+        ) as mock_download:
+            first, second = await asyncio.gather(
+                szv_mod._get_procedures(), szv_mod._get_procedures()
+            )
+
+        assert first is second
+        assert mock_download.call_count == 1
+
+
+class TestParseExcel:
+    """Rows are streamed from the workbook into procedure dicts."""
+
+    def test_skips_rows_without_code(self):
+        content = _export_xlsx([
+            ("Kód", "Název"),
+            ("09513", "EKG"),
+            (None, "bez kódu"),
+            ("12345",),
+        ])
+        procedures = szv_mod._parse_excel(content)
+        assert [p["Kód"] for p in procedures] == ["09513", "12345"]
+        assert procedures[0] == {"Kód": "09513", "Název": "EKG"}
+
+    def test_sheet_without_code_column(self):
+        content = _export_xlsx([("Název",), ("EKG",)])
+        assert szv_mod._parse_excel(content) == []
@@ -86,3 +86,15 @@ class TestSzvGetter:
 
         result = json.loads(await _szv_get("09513"))
         assert result["description"] == "Popis EKG"
+
+    @pytest.mark.asyncio
+    async def test_get_uses_first_row_for_code(self):
+        import czechmedmcp.czech.szv.search as mod
+        from czechmedmcp.czech.szv.search import _szv_get
+
+        mod._PROCEDURES = [
+            {"Kód": " A1 ", "Název": "First"},
+            {"Kód": "a1", "Název": "Second"},
+        ]
+        result = json.loads(await _szv_get("a1 "))
+        assert result["name"] == "First"
@@ -123,3 +123,16 @@ class TestSzvSearch:
             assert "error" in result
         finally:
             mod._PROCEDURES = old
+
+    def test_search_columns_built_once_per_list(self):
+        """Normalized columns are reused until _PROCEDURES is replaced."""
+        import czechmedmcp.czech.szv.search as mod
+
+        columns = mod._get_search_columns(mod._PROCEDURES)
+        fields = columns.text.split("\x00")
+        assert fields[1] == "ekg 12ti svodove"
+        assert fields[2::3] == ["101", "102"]
+        assert mod._get_search_columns(mod._PROCEDURES) is columns
+
+        replaced = list(_MOCK_PROCEDURES[1:])
+        assert mod._get_search_columns(replaced).text.startswith("12345\x00")
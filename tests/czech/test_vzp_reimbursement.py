@@ -1,7 +1,7 @@
 """Tests for VZP reimbursement data loader and fallback."""
 
 import json
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from czechmedmcp.czech.vzp.data_loader import (
     _parse_reimbursement_csv,
@@ -78,17 +78,12 @@ class TestLoadVzpData:
             status_code = 200
 
         class MockClient:
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, *a):
-                pass
-
             async def get(self, url, **kw):
                 return MockResp()
 
         with patch(
-            "czechmedmcp.czech.vzp.data_loader.httpx.AsyncClient",
+            "czechmedmcp.czech.vzp.data_loader.get_connection_pool",
+            new_callable=AsyncMock,
             return_value=MockClient(),
         ):
             data = await load_vzp_reimbursement_data()
@@ -105,18 +100,13 @@ class TestLoadVzpData:
             status_code = 500
 
         class MockClient:
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, *a):
-                pass
-
             async def get(self, url, **kw):
                 return MockResp()
 
         with (
             patch(
-                "czechmedmcp.czech.vzp.data_loader.httpx.AsyncClient",
+                "czechmedmcp.czech.vzp.data_loader.get_connection_pool",
+                new_callable=AsyncMock,
                 return_value=MockClient(),
             ),
             patch(
@@ -129,3 +129,152 @@ class TestVzpSearch:
             )
         )
         assert result["total"] >= 1
+
+    def test_search_columns_built_once_per_list(self):
+        """Normalized columns are reused until _ENTRIES is replaced."""
+        import czechmedmcp.czech.vzp.search as mod
+
+        columns = mod._get_search_columns(mod._ENTRIES)
+        assert columns.text.split("\x00")[1::3] == [
+            "ekg",
+            "esencialni hypertenze",
+        ]
+        assert mod._get_search_columns(mod._ENTRIES) is columns
+
+        replaced = list(_MOCK_ENTRIES[1:])
+        assert len(mod._get_search_columns(replaced).starts) == 1
+
+
+class TestDownloadCodebook:
+    """Parsed entries and columns are pickled and reloaded as-is."""
+
+    @pytest.mark.asyncio
+    async def test_parsed_entries_round_trip(self):
+        import io
+        import zipfile
+        from unittest.mock import AsyncMock, patch
+
+        import httpx
+
+        import czechmedmcp.czech.vzp.search as mod
+
+        row = ["09513", "101", "", "", "EKG", "Elektrokardiografie"]
+        row += [""] * (len(mod._VZP_FIELDS) - len(row))
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr(
+                "vykony.csv",
+                (",".join(row) + "\r\n").encode("cp852"),
+            )
+        mock_client = AsyncMock()
+        mock_client.get.return_value = httpx.Response(
+            200,
+            content=buf.getvalue(),
+            request=httpx.Request("GET", "http://x"),
+        )
+        with patch.object(
+            mod, "get_cached_response", return_value=None
+        ), patch.object(
+            mod, "cache_response"
+        ) as mock_cache, patch.object(
+            mod,
+            "get_connection_pool",
+            new_callable=AsyncMock,
+            return_value=mock_client,
+        ):
+            entries = await mod._download_codebook()
+
+        assert [e["KOD"] for e in entries] == ["09513"]
+        assert entries[0]["VYS"] == "Elektrokardiografie"
+        payload = mock_cache.call_args[0][1]
+        assert isinstance(payload, bytes)
+
+        with patch.object(
+            mod, "get_cached_response", return_value=payload
+        ), patch.object(
+            mod, "get_connection_pool", new_callable=AsyncMock
+        ) as mock_pool:
+            loaded = await mod._download_codebook()
+        mock_pool.assert_not_awaited()
+        assert loaded == entries
+        assert mod._COLUMNS.rows is loaded
+        assert mod._COLUMNS.by_code["09513"] is loaded[0]
+
+    @pytest.mark.asyncio
+    async def test_unreadable_parsed_cache_rebuilt(self):
+        """A truncated or foreign pickle is reparsed, not raised."""
+        import io
+        import pickle
+        import zipfile
+        from unittest.mock import AsyncMock, patch
+
+        import httpx
+
+        import czechmedmcp.czech.vzp.search as mod
+
+        row = ["09513", "101", "", "", "EKG"]
+        row += [""] * (len(mod._VZP_FIELDS) - len(row))
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("vykony.csv", ",".join(row).encode("cp852"))
+        payloads = [
+            pickle.dumps(mod._get_search_columns([]), protocol=5)[:-5],
+            pickle.dumps([{"KOD": "stale"}], protocol=5),
+        ]
+        for payload in payloads:
+            mock_client = AsyncMock()
+            mock_client.get.return_value = httpx.Response(
+                200,
+                content=buf.getvalue(),
+                request=httpx.Request("GET", "http://x"),
+            )
+            with patch.object(
+                mod, "get_cached_response", return_value=payload
+            ), patch.object(
+                mod, "cache_response"
+            ) as mock_cache, patch.object(
+                mod,
+                "get_connection_pool",
+                new_callable=AsyncMock,
+                return_value=mock_client,
+            ):
+                entries = await mod._download_codebook()
+            mock_cache.assert_called_once()
+            assert [e["KOD"] for e in entries] == ["09513"]
+
+    def test_parse_keeps_quoted_commas(self):
+        import io
+        import zipfile
+
+        import czechmedmcp.czech.vzp.search as mod
+
+        pad = "," * (len(mod._VZP_FIELDS) - 5)
+        text = (
+            ",".join(mod._VZP_FIELDS) + "\r\n"
+            + f'09513,101,,,"EKG, klidové"{pad}\r\n'
+            + "\r\n"
+            + "short,row\r\n"
+        )
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("vykony.csv", text.encode("cp852"))
+
+        entries = mod._parse_codebook(buf.getvalue())
+        assert len(entries) == 1
+        assert entries[0]["NAZ"] == "EKG, klidové"
+
+    def test_parse_shares_repeated_specialty(self):
+        import io
+        import zipfile
+
+        import czechmedmcp.czech.vzp.search as mod
+
+        pad = "," * (len(mod._VZP_FIELDS) - 2)
+        text = f"09513,interna{pad}\r\n09514,interna{pad}\r\n"
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("vykony.csv", text.encode("cp852"))
+
+        first, second = mod._parse_codebook(buf.getvalue())
+        assert first["ODB"] == "interna"
+        assert first["ODB"] is second["ODB"]
@@ -115,3 +115,35 @@ class TestReferralAssistant:
         assert "I25.1" in content
         assert "Brno" in content
         assert "kardiologie" in content
+
+    async def test_lookups_run_concurrently(self):
+        """MKN-10 lookup waits on the NRPZS search, so both must overlap."""
+        import asyncio
+
+        providers_started = asyncio.Event()
+
+        async def slow_mkn_get(code):
+            await asyncio.wait_for(providers_started.wait(), 1)
+            return MOCK_DIAGNOSIS
+
+        async def nrpzs_search(**kwargs):
+            providers_started.set()
+            return MOCK_PROVIDERS
+
+        with (
+            patch(
+                "czechmedmcp.czech.workflows."
+                "referral_assistant._mkn_get",
+                new=slow_mkn_get,
+            ),
+            patch(
+                "czechmedmcp.czech.workflows."
+                "referral_assistant._nrpzs_search",
+                new=nrpzs_search,
+            ),
+        ):
+            result = await _referral_assistant("I25.1", "Brno")
+
+        sc = json.loads(result)["structuredContent"]
+        assert sc["diagnosis_name"] == "Aterosklerotická nemoc srdeční"
+        assert len(sc["providers"]) == 2
@@ -0,0 +1,95 @@
+"""Tests for the cached article search entry point."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from czechmedmcp.articles import search_optimized
+from czechmedmcp.articles.search_optimized import article_searcher_optimized
+from czechmedmcp.shared_context import SearchContextManager
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    """Start every test with an empty article search cache."""
+    search_optimized._search_cache.cache.clear()
+    yield
+    search_optimized._search_cache.cache.clear()
+
+
+class TestArticleSearcherOptimized:
+    """Test caching and context reuse in article_searcher_optimized."""
+
+    @pytest.mark.asyncio
+    async def test_context_filters_invalid_genes(self):
+        """Genes rejected by the search context are dropped."""
+        with (
+            patch(
+                "czechmedmcp.articles.search_optimized.search_articles_unified",
+                new_callable=AsyncMock,
+                return_value="## Results",
+            ) as mock_search,
+            SearchContextManager(),
+        ):
+            await article_searcher_optimized(
+                call_benefit="test",
+                genes=["BRAF", "INVALID", "TP53"],
+            )
+
+        request = mock_search.call_args[0][0]
+        assert request.genes == ["BRAF", "TP53"]
+
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(self):
+        """Identical searches hit the unified search only once."""
+        with patch(
+            "czechmedmcp.articles.search_optimized.search_articles_unified",
+            new_callable=AsyncMock,
+            return_value="## Results",
+        ) as mock_search:
+            first = await article_searcher_optimized(
+                call_benefit="test", genes="BRAF,TP53"
+            )
+            second = await article_searcher_optimized(
+                call_benefit="test", genes=["TP53", "BRAF"]
+            )
+
+        assert first == second == "## Results"
+        assert mock_search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_key_uses_validated_genes(self):
+        """Invalid genes dropped by the context don't split the cache."""
+        with patch(
+            "czechmedmcp.articles.search_optimized.search_articles_unified",
+            new_callable=AsyncMock,
+            return_value="## Results",
+        ) as mock_search:
+            await article_searcher_optimized(
+                call_benefit="test", genes=["BRAF"]
+            )
+            with SearchContextManager():
+                await article_searcher_optimized(
+                    call_benefit="test", genes=["BRAF", "INVALID"]
+                )
+
+        assert mock_search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_request_model(self):
+        """A cache hit returns before a PubmedRequest is built."""
+        with (
+            patch(
+                "czechmedmcp.articles.search_optimized.search_articles_unified",
+                new_callable=AsyncMock,
+                return_value="## Results",
+            ),
+            patch(
+                "czechmedmcp.articles.search_optimized.PubmedRequest",
+                wraps=search_optimized.PubmedRequest,
+            ) as mock_model,
+        ):
+            await article_searcher_optimized(call_benefit="test", genes="BRAF")
+            await article_searcher_optimized(call_benefit="test", genes="BRAF")
+
+        assert mock_model.call_count == 1
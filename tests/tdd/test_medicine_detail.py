@@ -339,7 +339,8 @@ class TestFetchSubstanceName:
         ), patch(
             f"{mod}.cache_response",
         ), patch(
-            f"{mod}.httpx.AsyncClient",
+            f"{mod}.get_sukl_client",
+            new_callable=AsyncMock,
         ) as mock_client_cls:
             from unittest.mock import MagicMock
 
@@ -375,7 +376,8 @@ class TestFetchSubstanceName:
             f"{mod}.get_cached_response",
             return_value=None,
         ), patch(
-            f"{mod}.httpx.AsyncClient",
+            f"{mod}.get_sukl_client",
+            new_callable=AsyncMock,
         ) as mock_client_cls:
             mock_resp = AsyncMock()
             mock_resp.status_code = 404
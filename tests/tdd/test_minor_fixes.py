@@ -9,6 +9,7 @@ Covers:
 import json
 from unittest.mock import AsyncMock, patch
 
+from czechmedmcp.czech.mkn.parser import MknNode
 from czechmedmcp.czech.mkn.synonyms import (
     CZ_MEDICAL_SYNONYMS,
     PREVALENCE_BOOST,
@@ -98,34 +99,30 @@ class TestPrevalenceBoost:
 def _make_code_index():
     """Build a minimal code index for testing."""
     return {
-        "E11": {
-            "code": "E11",
-            "name_cs": "Diabetes mellitus 2. typu",
-            "kind": "category",
-            "parent_code": "E10-E14",
-            "children": [],
-        },
-        "E10": {
-            "code": "E10",
-            "name_cs": "Diabetes mellitus 1. typu",
-            "kind": "category",
-            "parent_code": "E10-E14",
-            "children": [],
-        },
-        "I10": {
-            "code": "I10",
-            "name_cs": "Esenciální hypertenze",
-            "kind": "category",
-            "parent_code": "I10-I15",
-            "children": [],
-        },
-        "J45": {
-            "code": "J45",
-            "name_cs": "Astma",
-            "kind": "category",
-            "parent_code": "J40-J47",
-            "children": [],
-        },
+        "E11": MknNode(
+            code="E11",
+            name_cs="Diabetes mellitus 2. typu",
+            kind="category",
+            parent_code="E10-E14",
+        ),
+        "E10": MknNode(
+            code="E10",
+            name_cs="Diabetes mellitus 1. typu",
+            kind="category",
+            parent_code="E10-E14",
+        ),
+        "I10": MknNode(
+            code="I10",
+            name_cs="Esenciální hypertenze",
+            kind="category",
+            parent_code="I10-I15",
+        ),
+        "J45": MknNode(
+            code="J45",
+            name_cs="Astma",
+            kind="category",
+            parent_code="J40-J47",
+        ),
     }
 
 
@@ -1,6 +1,6 @@
 """Unit tests for SUKL SearchMedicine / DrugIndex."""
 
-import json
+import pickle
 from unittest.mock import patch
 
 import pytest
@@ -9,6 +9,7 @@ from czechmedmcp.czech.sukl.drug_index import (
     DrugIndex,
     DrugIndexEntry,
     _detail_to_entry,
+    _get_postings,
     reset_drug_index,
     search_index,
 )
@@ -91,11 +92,19 @@ class TestDrugIndexPersistentCache:
                 "holder_code": "x",
             }
         ]
+        seeded = DrugIndex()
+        seeded._entries = [DrugIndexEntry(**e) for e in cached_entries]
+        payload = pickle.dumps((
+            [tuple(e.values()) for e in cached_entries],
+            _get_postings(seeded),
+            "rev",
+            0.0,
+        ))
         idx = DrugIndex()
 
         with patch(
             "czechmedmcp.czech.sukl.drug_index.get_cached_response",
-            return_value=json.dumps(cached_entries),
+            return_value=payload,
         ):
             await idx.ensure_built()
             assert idx.size == 1
@@ -5,6 +5,7 @@ import asyncio
 import pytest
 
 from czechmedmcp.utils.request_cache import (
+    LRUCache,
     clear_cache,
     get_cached,
     request_cache,
@@ -79,6 +80,28 @@ class TestRequestCache:
         assert result3 == "c-d-2"
         assert call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_methods_share_entries_across_instances(self):
+        """Bound self is not part of the key; the class name is."""
+        calls = []
+
+        class Client:
+            @request_cache(ttl=10)
+            async def fetch(self, arg):
+                calls.append(arg)
+                return f"client-{arg}"
+
+        class OtherClient:
+            @request_cache(ttl=10)
+            async def fetch(self, arg):
+                calls.append(arg)
+                return f"other-{arg}"
+
+        assert await Client().fetch("a") == "client-a"
+        assert await Client().fetch("a") == "client-a"
+        assert await OtherClient().fetch("a") == "other-a"
+        assert calls == ["a", "a"]
+
     @pytest.mark.asyncio
     async def test_skip_cache_option(self):
         """Test that skip_cache bypasses caching."""
@@ -132,3 +155,15 @@ class TestRequestCache:
         result4 = await sometimes_none_function(return_none=False)
         assert result4 == 3
         assert call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_nowait(self):
+        """get_nowait returns live entries and drops expired ones."""
+        cache = LRUCache(max_size=10)
+        await cache.set("live", "value", ttl=10)
+        await cache.set("stale", "value", ttl=-1)
+
+        assert cache.get_nowait("live") == "value"
+        assert cache.get_nowait("stale") is None
+        assert "stale" not in cache.cache
+        assert cache.get_nowait("missing") is None
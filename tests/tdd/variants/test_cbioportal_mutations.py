@@ -1,11 +1,13 @@
 """Tests for cBioPortal mutation-specific search functionality."""
 
+import asyncio
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from czechmedmcp.utils.mutation_filter import MutationFilter
 from czechmedmcp.variants.cbioportal_mutations import (
     CBioPortalMutationClient,
-    MutationHit,
     StudyMutationSummary,
     format_mutation_search_result,
 )
@@ -82,62 +84,38 @@ class TestCBioPortalMutationSearch:
         assert any("melanoma" in ct.lower() for ct in cancer_types)
 
     def test_filter_mutations_specific(self):
-        """Test filtering for specific mutations."""
+        """Test filtering raw records for specific mutations."""
         mutations = [
-            MutationHit(
-                study_id="study1",
-                molecular_profile_id="study1_mutations",
-                protein_change="F57Y",
-                mutation_type="Missense",
-            ),
-            MutationHit(
-                study_id="study1",
-                molecular_profile_id="study1_mutations",
-                protein_change="F57C",
-                mutation_type="Missense",
-            ),
-            MutationHit(
-                study_id="study2",
-                molecular_profile_id="study2_mutations",
-                protein_change="R88Q",
-                mutation_type="Missense",
-            ),
+            {"molecularProfileId": "s1_mutations", "proteinChange": "F57Y"},
+            {"molecularProfileId": "s1_mutations", "proteinChange": "F57C"},
+            {"molecularProfileId": "s2_mutations", "proteinChange": "R88Q"},
         ]
 
         # Filter for F57Y
-        mutation_filter = MutationFilter(specific_mutation="F57Y")
-        filtered = mutation_filter.filter_mutations(mutations)
-        assert len(filtered) == 1
-        assert filtered[0].protein_change == "F57Y"
+        summaries, mutation_types = (
+            CBioPortalMutationClient()._aggregate_by_study(
+                mutations, {}, MutationFilter(specific_mutation="F57Y")
+            )
+        )
+        assert mutation_types == {"F57Y": 1}
+        assert list(summaries) == ["s1"]
 
     def test_filter_mutations_pattern(self):
-        """Test filtering with wildcard patterns."""
+        """Test filtering raw records with wildcard patterns."""
         mutations = [
-            MutationHit(
-                study_id="study1",
-                molecular_profile_id="study1_mutations",
-                protein_change="F57Y",
-                mutation_type="Missense",
-            ),
-            MutationHit(
-                study_id="study1",
-                molecular_profile_id="study1_mutations",
-                protein_change="F57C",
-                mutation_type="Missense",
-            ),
-            MutationHit(
-                study_id="study2",
-                molecular_profile_id="study2_mutations",
-                protein_change="R88Q",
-                mutation_type="Missense",
-            ),
+            {"molecularProfileId": "s1_mutations", "proteinChange": "F57Y"},
+            {"molecularProfileId": "s1_mutations", "proteinChange": "F57C"},
+            {"molecularProfileId": "s2_mutations", "proteinChange": "R88Q"},
         ]
 
         # Filter for F57*
-        mutation_filter = MutationFilter(pattern="F57*")
-        filtered = mutation_filter.filter_mutations(mutations)
-        assert len(filtered) == 2
-        assert all(m.protein_change.startswith("F57") for m in filtered)
+        summaries, mutation_types = (
+            CBioPortalMutationClient()._aggregate_by_study(
+                mutations, {}, MutationFilter(pattern="F57*")
+            )
+        )
+        assert mutation_types == {"F57Y": 1, "F57C": 1}
+        assert summaries["s1"].mutations == ["F57Y", "F57C"]
 
     def test_format_mutation_search_result(self):
         """Test formatting of mutation search results."""
@@ -177,3 +155,344 @@ class TestCBioPortalMutationSearch:
         assert "**Studies with Mutation**: 3" in formatted
         assert "msk_ch_2023" in formatted
         assert "|     5 |" in formatted  # mutation count
+
+
+class TestMutationSearchFlow:
+    """Test request ordering in _search_mutations_with_adapter."""
+
+    @pytest.mark.asyncio
+    async def test_studies_fetched_during_mutation_fetch(self):
+        """Study info is requested before the mutation batch returns."""
+        client = CBioPortalMutationClient()
+        studies_started = asyncio.Event()
+
+        async def fetch_mutations(profile_ids, entrez_id):
+            await asyncio.wait_for(studies_started.wait(), timeout=1)
+            return [
+                {
+                    "molecularProfileId": "study1_mutations",
+                    "proteinChange": "F57Y",
+                    "mutationType": "Missense",
+                    "sampleId": "s1",
+                }
+            ]
+
+        async def studies_info():
+            studies_started.set()
+            return {"study1": {"name": "Study 1", "cancer_type": "mds"}}
+
+        with (
+            patch.object(
+                client, "get_gene_id", AsyncMock(return_value=6427)
+            ),
+            patch.object(
+                client,
+                "get_mutation_profiles",
+                AsyncMock(
+                    return_value=[{"molecularProfileId": "study1_mutations"}]
+                ),
+            ),
+            patch.object(
+                client, "_fetch_all_mutations", side_effect=fetch_mutations
+            ),
+            patch.object(
+                client, "_get_studies_info", side_effect=studies_info
+            ),
+        ):
+            result = await client._search_mutations_with_adapter(
+                "SRSF2", "F57Y", None, 10
+            )
+
+        assert result.studies_with_mutation == 1
+        assert result.top_studies[0].study_name == "Study 1"
+
+    @pytest.mark.asyncio
+    async def test_unknown_gene_skips_mutation_fetch(self):
+        client = CBioPortalMutationClient()
+        with (
+            patch.object(
+                client, "get_gene_id", AsyncMock(return_value=None)
+            ),
+            patch.object(
+                client, "get_mutation_profiles", AsyncMock(return_value=[])
+            ),
+            patch.object(
+                client, "_fetch_all_mutations", AsyncMock()
+            ) as mock_fetch,
+        ):
+            result = await client._search_mutations_with_adapter(
+                "NOPE", None, None, 10
+            )
+
+        assert result is None
+        mock_fetch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_normalized_calls_share_cache_entry(self):
+        """Gene casing and new client instances don't split the cache."""
+        from czechmedmcp.variants.cbioportal_mutations import (
+            MutationSearchResult,
+        )
+
+        mock_search = AsyncMock(
+            return_value=MutationSearchResult(gene="BRAF")
+        )
+        with patch.object(
+            CBioPortalMutationClient,
+            "_search_mutations_with_adapter",
+            mock_search,
+        ):
+            first = await CBioPortalMutationClient().search_specific_mutation(
+                "BRAF", mutation="V600E", max_studies=7
+            )
+            second = await CBioPortalMutationClient().search_specific_mutation(
+                " braf ", mutation="V600E ", max_studies=7
+            )
+
+        assert first is second
+        mock_search.assert_awaited_once_with("BRAF", "V600E", None, 7)
+
+
+class TestFetchMutationsBatch:
+    """Test chunked /mutations/fetch requests."""
+
+    @pytest.mark.asyncio
+    async def test_large_profile_lists_fetched_in_chunks(self):
+        """Each chunk is its own POST; results keep profile order."""
+        from czechmedmcp.variants import cbio_core
+
+        client = CBioPortalMutationClient()
+        profile_ids = [
+            f"p{i}" for i in range(2 * cbio_core.MUTATION_FETCH_CHUNK_SIZE + 1)
+        ]
+
+        async def post(path, data, **kwargs):
+            ids = data["molecularProfileIds"]
+            if ids[0] == "p0":
+                return None, "HTTP 500"
+            return [{"molecularProfileId": i} for i in ids], None
+
+        with patch.object(
+            client.http_adapter, "post", side_effect=post
+        ) as mock_post:
+            records = await client.fetch_mutations_batch(6427, profile_ids)
+
+        assert mock_post.call_count == 3
+        size = cbio_core.MUTATION_FETCH_CHUNK_SIZE
+        assert [r["molecularProfileId"] for r in records] == profile_ids[
+            size:
+        ]
+
+
+class TestGetMutationProfiles:
+    """Test the in-process molecular profile cache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_fetch(self):
+        from czechmedmcp.variants import cbio_core
+
+        profiles = [{"molecularProfileId": "s1_mutations"}]
+
+        async def get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return profiles, None
+
+        adapter_get = AsyncMock(side_effect=get)
+        clients = [CBioPortalMutationClient() for _ in range(3)]
+        with (
+            patch.object(
+                cbio_core, "_PROFILES_CACHE", cbio_core.LRUCache(16)
+            ),
+            patch(
+                "czechmedmcp.utils.cbio_http_adapter.CBioHTTPAdapter.get",
+                adapter_get,
+            ),
+        ):
+            results = await asyncio.gather(
+                *(c.get_mutation_profiles() for c in clients)
+            )
+            again = await clients[0].get_mutation_profiles()
+
+        assert all(r is profiles for r in results)
+        assert again is profiles
+        assert adapter_get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_not_cached(self):
+        from czechmedmcp.variants import cbio_core
+
+        client = CBioPortalMutationClient()
+        with (
+            patch.object(
+                cbio_core, "_PROFILES_CACHE", cbio_core.LRUCache(16)
+            ),
+            patch.object(
+                client.http_adapter,
+                "get",
+                AsyncMock(return_value=(None, "HTTP 500")),
+            ) as mock_get,
+        ):
+            assert await client.get_mutation_profiles() == []
+            assert await client.get_mutation_profiles() == []
+
+        assert mock_get.await_count == 2
+
+
+class TestGetStudiesInfo:
+    """Test cancer type resolution in _get_studies_info."""
+
+    @pytest.mark.asyncio
+    async def test_cancer_type_resolved_once_per_id(self):
+        client = CBioPortalMutationClient()
+        studies = [
+            {"studyId": "s1", "name": "One", "cancerTypeId": "mel"},
+            {"studyId": "s2", "name": "Two", "cancerTypeId": "mel"},
+            {"studyId": "s3", "name": "Three", "cancerTypeId": "unknown"},
+        ]
+        ct_client = AsyncMock()
+        ct_client.get_cancer_type_name.return_value = "Melanoma"
+        ct_client.get_study_cancer_type.return_value = "Glioma"
+
+        with (
+            patch.object(
+                client.http_adapter,
+                "get",
+                AsyncMock(return_value=(studies, None)),
+            ),
+            patch(
+                "czechmedmcp.variants.cbioportal_mutations"
+                ".get_cancer_type_client",
+                return_value=ct_client,
+            ),
+        ):
+            info = await client._get_studies_info()
+
+        assert info == {
+            "s1": {"name": "One", "cancer_type": "Melanoma"},
+            "s2": {"name": "Two", "cancer_type": "Melanoma"},
+            "s3": {"name": "Three", "cancer_type": "Glioma"},
+        }
+        ct_client.get_cancer_type_name.assert_awaited_once_with("mel")
+        ct_client.get_study_cancer_type.assert_awaited_once_with("s3")
+
+    @pytest.mark.asyncio
+    async def test_study_fallback_lookups_bounded(self):
+        from czechmedmcp.variants import cbioportal_mutations
+
+        client = CBioPortalMutationClient()
+        limit = cbioportal_mutations.STUDY_CANCER_TYPE_CONCURRENCY
+        studies = [
+            {"studyId": f"s{i}", "name": f"Study {i}"}
+            for i in range(3 * limit)
+        ]
+        in_flight = peak = 0
+
+        async def study_cancer_type(study_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return f"type {study_id}"
+
+        ct_client = AsyncMock()
+        ct_client.get_study_cancer_type.side_effect = study_cancer_type
+
+        with (
+            patch.object(
+                client.http_adapter,
+                "get",
+                AsyncMock(return_value=(studies, None)),
+            ),
+            patch(
+                "czechmedmcp.variants.cbioportal_mutations"
+                ".get_cancer_type_client",
+                return_value=ct_client,
+            ),
+        ):
+            info = await client._get_studies_info()
+
+        assert peak == limit
+        assert info["s7"]["cancer_type"] == "type s7"
+        assert len(info) == len(studies)
+
+
+class TestAggregateByStudy:
+    """Test per-study aggregation of raw mutation records."""
+
+    def test_counts_samples_and_unique_mutations(self):
+        client = CBioPortalMutationClient()
+        changes = ["F57Y", "F57C", "F57Y", "F57S", "F57L", "F57V", "F57I"]
+        mutations = [
+            {
+                "molecularProfileId": "s1_mutations",
+                "proteinChange": change,
+                "sampleId": f"p{i % 3}",
+            }
+            for i, change in enumerate(changes)
+        ] + [{"molecularProfileId": "s2_mutations", "proteinChange": "F57Y"}]
+
+        summaries, mutation_types = client._aggregate_by_study(
+            mutations, {"s1": {"name": "One", "cancer_type": "mel"}}
+        )
+
+        s1, s2 = summaries["s1"], summaries["s2"]
+        assert (s1.study_name, s1.cancer_type) == ("One", "mel")
+        assert s1.mutation_count == 7
+        assert s1.sample_count == 3
+        assert s1.mutations == ["F57Y", "F57C", "F57S", "F57L", "F57V"]
+        assert (s2.study_name, s2.cancer_type) == ("s2", "unknown")
+        assert (s2.mutation_count, s2.sample_count) == (1, 0)
+        assert mutation_types["F57Y"] == 3
+        assert mutation_types.total() == 8
+
+    def test_filter_applied_during_aggregation(self):
+        client = CBioPortalMutationClient()
+        mutations = [
+            {"molecularProfileId": "s1_mutations", "proteinChange": "F57Y"},
+            {"molecularProfileId": "s1_mutations", "proteinChange": "R88Q"},
+            {"molecularProfileId": "s2_mutations", "proteinChange": "R88Q"},
+            {"molecularProfileId": "s2_mutations", "proteinChange": "F57C"},
+        ]
+
+        summaries, mutation_types = client._aggregate_by_study(
+            mutations, {}, MutationFilter(pattern="F57*")
+        )
+
+        assert {k: v.mutations for k, v in summaries.items()} == {
+            "s1": ["F57Y"],
+            "s2": ["F57C"],
+        }
+        assert mutation_types == {"F57Y": 1, "F57C": 1}
+
+        summaries, _ = client._aggregate_by_study(
+            mutations, {}, MutationFilter(pattern="R88Q")
+        )
+        assert sorted(summaries) == ["s1", "s2"]
+
+
+class TestFetchAllMutations:
+    """Test record handling in _fetch_all_mutations."""
+
+    @pytest.mark.asyncio
+    async def test_records_without_string_fields_dropped(self):
+        client = CBioPortalMutationClient()
+        raw = [
+            {"molecularProfileId": "s1_mutations", "proteinChange": "F57Y"},
+            {"molecularProfileId": "s1_mutations", "proteinChange": None},
+            {"molecularProfileId": None, "proteinChange": "F57C"},
+            {"molecularProfileId": "s2_mutations"},
+            {"molecularProfileId": "s2_mutations", "mutationType": None},
+            {"molecularProfileId": "s2_mutations", "sampleId": 17},
+            {"molecularProfileId": "s2_mutations", "sampleId": None},
+            {"molecularProfileId": "s2_mutations", "startPosition": 140},
+            {"molecularProfileId": "s2_mutations", "endPosition": "141"},
+            {"molecularProfileId": "s2_mutations", "startPosition": 1.5},
+            {"molecularProfileId": "s2_mutations", "endPosition": "x"},
+        ]
+        with patch.object(
+            client, "fetch_mutations_batch", AsyncMock(return_value=raw)
+        ):
+            mutations = await client._fetch_all_mutations(["s1"], 6427)
+
+        assert mutations == [raw[0], raw[3], raw[6], raw[7], raw[8]]